@@ -2,6 +2,60 @@
 # Copyright (c) 2024 Club Maquis
 """Shared utilities for Club Maquis scripts."""
 
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any
+
+from scripts.common.binlogger import MsgpackLogger
 from scripts.common.logger import JSONLLogger
 
-__all__ = ["JSONLLogger"]
+# Environment variable selecting the session log format ("jsonl" or "msgpack")
+LOG_FORMAT_ENV = "CLUBMAQUIS_LOG_FORMAT"
+
+
+# Logger class for each supported format; the format name doubles as the file extension
+LOG_FORMATS: dict[str, type[JSONLLogger]] = {"jsonl": JSONLLogger, "msgpack": MsgpackLogger}
+
+# Extensions of session log files, whichever format wrote them
+LOG_EXTENSIONS = frozenset(f".{fmt}" for fmt in LOG_FORMATS)
+
+
+def resolve_log_format(fmt: str | None = None) -> str:
+    """Resolve and validate the session log format.
+
+    Args:
+        fmt: "jsonl" or "msgpack"; defaults to $CLUBMAQUIS_LOG_FORMAT, else "jsonl".
+
+    Returns:
+        The lower-cased format name, also usable as the log file extension.
+
+    Raises:
+        ValueError: If the format is not recognized.
+    """
+    fmt = (fmt or os.environ.get(LOG_FORMAT_ENV) or "jsonl").lower()
+    if fmt not in LOG_FORMATS:
+        raise ValueError(f"Unknown log format '{fmt}' (expected 'jsonl' or 'msgpack')")
+    return fmt
+
+
+def make_logger(log_path: Path, fmt: str | None = None, **kwargs: Any) -> JSONLLogger:
+    """Create a session logger in the requested format.
+
+    Args:
+        log_path: Path to the log file (will be created if needed).
+        fmt: "jsonl" or "msgpack"; defaults to $CLUBMAQUIS_LOG_FORMAT, else "jsonl".
+        **kwargs: Passed through to the logger constructor.
+
+    Returns:
+        JSONLLogger or MsgpackLogger instance.
+
+    Raises:
+        ValueError: If the format is not recognized.
+        ImportError: If msgpack is selected but not installed.
+    """
+    return LOG_FORMATS[resolve_log_format(fmt)](log_path, **kwargs)
+
+
+__all__ = ["LOG_EXTENSIONS", "LOG_FORMAT_ENV", "JSONLLogger", "MsgpackLogger", "make_logger", "resolve_log_format"]
@@ -0,0 +1,102 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Club Maquis
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Optional Cython encoder for JSONLLogger entries.
+
+Used by scripts.common.logger when orjson is not installed. Build in place
+from the repository root with Cython installed (plain `cythonize -i` would
+follow the src/ layout in pyproject.toml and fail to copy the module back):
+
+    python -c "from Cython.Build import cythonize; from setuptools import setup; \\
+        setup(script_args=['build_ext', '--inplace'], package_dir={'': '.'}, \\
+              ext_modules=cythonize('scripts/common/_logger_fast.pyx'))"
+
+Handles the value types session logs actually contain (str, int, bool, None)
+inline and defers anything else to the stdlib json encoder. Output must stay
+byte-identical to the stdlib encoding; tests/test_logger.py checks this
+whenever the module is built.
+"""
+
+import json
+
+from cpython.dict cimport PyDict_Next
+from cpython.object cimport PyObject
+
+cdef bytes _HEX = b"0123456789abcdef"
+
+
+cdef inline void _append_str(bytearray out, str s) except *:
+    """Append s to out as a JSON string literal, escaped exactly as json.dumps does."""
+    cdef Py_UCS4 uch
+    cdef unsigned int ch
+    out.append(0x22)
+    for uch in s:
+        ch = <unsigned int>uch
+        if ch == 0x22:
+            out += b'\\"'
+        elif ch == 0x5C:
+            out += b"\\\\"
+        elif ch == 0x0A:
+            out += b"\\n"
+        elif ch == 0x0D:
+            out += b"\\r"
+        elif ch == 0x09:
+            out += b"\\t"
+        elif ch == 0x08:
+            out += b"\\b"
+        elif ch == 0x0C:
+            out += b"\\f"
+        elif ch < 0x20:
+            out += b"\\u00"
+            out.append(_HEX[ch >> 4])
+            out.append(_HEX[ch & 0xF])
+        elif ch < 0x80:
+            out.append(ch)
+        else:
+            # Lone surrogates raise UnicodeEncodeError, as with json.dumps(...).encode()
+            out += chr(uch).encode("utf-8")
+    out.append(0x22)
+
+
+cdef inline void _append_value(bytearray out, object value) except *:
+    """Append a JSON value, dispatching on exact type for the common cases."""
+    if value is None:
+        out += b"null"
+    elif value is True:
+        out += b"true"
+    elif value is False:
+        out += b"false"
+    elif type(value) is str:
+        _append_str(out, <str>value)
+    elif type(value) is int:
+        out += str(value).encode("ascii")
+    else:
+        out += json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+cpdef bytes encode_entry(str ts, str action, dict extra):
+    """Encode a log entry as compact JSON bytes (without trailing newline).
+
+    Args:
+        ts: ISO 8601 timestamp string.
+        action: Action identifier.
+        extra: Additional fields, in insertion order.
+
+    Returns:
+        Bytes equal to the compact json.dumps of {"timestamp": ts, "action": action, **extra}.
+    """
+    cdef bytearray out = bytearray(b'{"timestamp":')
+    cdef Py_ssize_t pos = 0
+    cdef PyObject *key
+    cdef PyObject *value
+
+    _append_str(out, ts)
+    out += b',"action":'
+    _append_str(out, action)
+    while PyDict_Next(extra, &pos, &key, &value):
+        out.append(0x2C)
+        _append_str(out, <str>key)
+        out.append(0x3A)
+        _append_value(out, <object>value)
+    out.append(0x7D)
+    return bytes(out)
@@ -0,0 +1,90 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Club Maquis
+"""Binary (msgpack) session logger, a compact alternative to JSONLLogger."""
+
+from __future__ import annotations
+
+import struct
+from typing import Any
+
+from scripts.common.logger import FLUSH_ACTIONS, LOG_SCHEMA, JSONLLogger
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None  # type: ignore[assignment]
+
+# Big-endian uint32 length prefix written before each record
+RECORD_HEADER = struct.Struct(">I")
+
+
+class MsgpackLogger(JSONLLogger):
+    """Logs actions as length-prefixed msgpack records.
+
+    Same API, buffering and background writer as JSONLLogger, but each entry
+    is written as a 4-byte big-endian length followed by the msgpack-encoded
+    entry dict. Records are smaller and cheaper to encode than JSON lines,
+    at the cost of not being human-readable. Use read_records() to decode.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize logger; accepts the same arguments as JSONLLogger.
+
+        Raises:
+            ImportError: If the msgpack package is not installed.
+        """
+        if msgpack is None:
+            raise ImportError("MsgpackLogger requires the msgpack package")
+        super().__init__(*args, **kwargs)
+
+    def _write_record(self, entry: dict[str, Any], flush: bool = False) -> None:
+        """Encode an entry and queue it with its length prefix."""
+        packed = msgpack.packb(entry, use_bin_type=True)
+        self._write_bytes(RECORD_HEADER.pack(len(packed)) + packed, flush)
+
+    def _write_schema(self) -> None:
+        """Write the log schema as the first entry."""
+        key, stamp, _ = self._stamp()
+        self._write_record({key: stamp, "action": "log_schema", "schema": LOG_SCHEMA}, flush=True)
+
+    def log(self, action: str, **kwargs: Any) -> dict[str, Any]:
+        """Log an action with timestamp.
+
+        Args:
+            action: Name of the action being logged.
+            **kwargs: Additional key-value pairs to include in the log entry.
+
+        Returns:
+            The complete log entry dict that was written.
+
+        Raises:
+            OSError: If a FLUSH_ACTIONS entry (or an earlier queued one) cannot be written.
+        """
+        key, stamp, _ = self._stamp()
+        entry = {key: stamp, "action": action, **kwargs}
+        self._write_record(entry, flush=action in FLUSH_ACTIONS)
+        return entry
+
+
+def read_records(data: bytes) -> list[dict[str, Any]]:
+    """Decode the contents of a MsgpackLogger file.
+
+    Args:
+        data: Raw file contents.
+
+    Returns:
+        Log entries in the order they were written.
+
+    Raises:
+        ImportError: If the msgpack package is not installed.
+    """
+    if msgpack is None:
+        raise ImportError("read_records requires the msgpack package")
+    entries = []
+    offset = 0
+    while offset < len(data):
+        (length,) = RECORD_HEADER.unpack_from(data, offset)
+        offset += RECORD_HEADER.size
+        entries.append(msgpack.unpackb(data[offset : offset + length], raw=False))
+        offset += length
+    return entries
@@ -4,14 +4,30 @@
 
 from __future__ import annotations
 
+import atexit
+import io
 import json
+import os
+import queue
 import sys
-from datetime import UTC, datetime
+import threading
+import time
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Optional compiled encoder (see _logger_fast.pyx), used when orjson is missing
+try:
+    from scripts.common._logger_fast import encode_entry as _encode_entry_fast
+except ImportError:
+    _encode_entry_fast = None
+
 # Log schema version for forward compatibility
-LOG_SCHEMA_VERSION = "1.0.0"
+LOG_SCHEMA_VERSION = "2.0.0"
 
 # Known actions and their expected fields (for documentation)
 LOG_SCHEMA = {
@@ -19,6 +35,7 @@ LOG_SCHEMA = {
     "description": "Club Maquis session log - JSONL format with UTC timestamps",
     "fields": {
         "timestamp": "ISO 8601 UTC timestamp (e.g., 2025-01-01T12:30:00.123456+00:00)",
+        "t": "Integer nanoseconds since the Unix epoch; replaces timestamp in loggers created with ns_timestamps=True",
         "action": "Action identifier (see known_actions)",
     },
     "known_actions": {
@@ -36,6 +53,39 @@ LOG_SCHEMA = {
 }
 
 
+def _dumps(obj: Any) -> bytes:
+    """Serialize an object to compact UTF-8 JSON bytes (orjson when available).
+
+    The stdlib fallback uses the same compact separators and unescaped
+    non-ASCII output as orjson, so log lines look identical either way.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+# Schema entry minus its leading '{' and per-file timestamp, serialized once
+_SCHEMA_TAIL = _dumps({"action": "log_schema", "schema": LOG_SCHEMA})[1:]
+
+# Pre-encoded `,"action":"<name>"}` suffix for known actions logged without extra fields
+_ACTION_SUFFIX: dict[str, bytes] = {name: b',"action":' + _dumps(name) + b"}" for name in LOG_SCHEMA["known_actions"]}
+
+# Size of the write buffer; a full buffer is written to disk in one call
+FLUSH_THRESHOLD_BYTES = 64 * 1024
+
+# Actions that mark session milestones and are written to disk immediately
+FLUSH_ACTIONS = frozenset(
+    {
+        "log_schema",
+        "session_created",
+        "setup_complete",
+        "shutdown_started",
+        "shutdown_complete",
+        "process_complete",
+    }
+)
+
+
 class JSONLLogger:
     """Logs actions to a JSONL file with UTC timestamps.
 
@@ -43,48 +93,176 @@ class JSONLLogger:
     {"timestamp": "2025-01-01T12:30:00.123456+00:00", "action": "...", ...}
 
     The first entry in each log file is a schema entry documenting the format.
+
+    Create one logger per session and share it across every step, preferably
+    as a context manager so the file is flushed and closed when done:
+
+        with JSONLLogger(log_path) as logger:
+            check_launchpad(logger)
+            launch_quicktime(logger)
+
+    log() serializes the entry and hands it to a background writer thread, so
+    callers never wait on disk I/O. The writer appends through a long-lived
+    io.BufferedWriter; entries reach disk once FLUSH_THRESHOLD_BYTES
+    accumulate, when a FLUSH_ACTIONS entry is logged, or when flush()/close()
+    is called (close() also runs at exit). Write errors are reported on stderr
+    and re-raised from the next flush() or close().
     """
 
-    def __init__(self, log_path: Path, write_schema: bool = True) -> None:
+    # Absolute paths of log files this process has already opened; their
+    # directory and schema entry are known to exist, so no stat is needed.
+    _known_paths: set[str] = set()
+
+    def __init__(self, log_path: Path, write_schema: bool = True, ns_timestamps: bool = False) -> None:
         """Initialize logger with path to log file.
 
         Args:
             log_path: Path to the JSONL log file (will be created if needed).
             write_schema: If True and log file is new, write schema as first entry.
+            ns_timestamps: If True, stamp entries with an integer "t" field
+                (time.time_ns()) instead of the ISO 8601 "timestamp" string.
         """
         self.log_path = log_path
-        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ns_timestamps = ns_timestamps
+        key = os.path.abspath(log_path)
+        if key in JSONLLogger._known_paths:
+            is_new = False
+        else:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            is_new = not self.log_path.exists()
+
+        self._fh: io.BufferedWriter | None = None
+        self._queue: queue.SimpleQueue[bytes | threading.Event | None] = queue.SimpleQueue()
+        self._writer: threading.Thread | None = None
+        self._write_error: OSError | None = None
+        self._open()
+        JSONLLogger._known_paths.add(key)
+
+        # (second, formatted prefix), replaced as one tuple so concurrent callers never mix them
+        self._ts_cache: tuple[int, str] = (-1, "")
 
         # Write schema entry if this is a new log file
-        if write_schema and not self.log_path.exists():
+        if write_schema and is_new:
             self._write_schema()
 
-    def _write_entry(self, entry: dict[str, Any], mode: str = "a") -> None:
-        """Write an entry to the log file with error handling.
+    def _write_bytes(self, payload: bytes, flush: bool = False) -> None:
+        """Queue a serialized record for the writer thread.
+
+        Args:
+            payload: Complete record bytes (a newline-terminated JSON line here).
+            flush: If True, wait until the line has been written to disk.
+
+        Raises:
+            OSError: If flush is True and writing fails (disk full, permission denied, etc.).
+        """
+        self._open()
+        self._queue.put(payload)
+        if flush:
+            self.flush()
+
+    def _open(self) -> None:
+        """Open the log file, start the writer thread, and register close() to run at exit."""
+        if self._fh is not None:
+            return
+        self._fh = io.BufferedWriter(io.FileIO(self.log_path, "a"), buffer_size=FLUSH_THRESHOLD_BYTES)
+        self._writer = threading.Thread(target=self._drain, args=(self._fh,), name=f"JSONLLogger({self.log_path.name})", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _drain(self, fh: io.BufferedWriter) -> None:
+        """Writer thread: append queued lines until the None sentinel arrives.
 
         Args:
-            entry: The log entry dict to write.
-            mode: File open mode ('w' for write, 'a' for append).
+            fh: Buffered log file owned by this thread until the sentinel.
+        """
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    fh.close()
+                    return
+                if isinstance(item, threading.Event):
+                    fh.flush()
+                    item.set()
+                else:
+                    fh.write(item)
+            except OSError as e:
+                # Print to stderr as fallback since we can't log
+                print(f"ERROR: Failed to write log entry to {self.log_path}: {e}", file=sys.stderr)
+                self._write_error = e
+                if isinstance(item, threading.Event):
+                    item.set()
+                elif item is None:
+                    return
+
+    def _raise_write_error(self) -> None:
+        """Re-raise (once) any error the writer thread hit."""
+        error, self._write_error = self._write_error, None
+        if error is not None:
+            raise error
+
+    def flush(self) -> None:
+        """Wait until all queued entries have been written to the log file.
+
+        Raises:
+            OSError: If writing fails (disk full, permission denied, etc.).
+        """
+        if self._fh is None:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+        self._raise_write_error()
+
+    def close(self) -> None:
+        """Write queued entries, stop the writer thread, and close the log file.
 
         Raises:
             OSError: If writing fails (disk full, permission denied, etc.).
         """
-        try:
-            with self.log_path.open(mode, encoding="utf-8") as f:
-                f.write(json.dumps(entry) + "\n")
-        except OSError as e:
-            # Print to stderr as fallback since we can't log
-            print(f"ERROR: Failed to write log entry to {self.log_path}: {e}", file=sys.stderr)
-            raise
+        if self._fh is None:
+            return
+        self._queue.put(None)
+        self._writer.join()
+        self._fh = None
+        self._writer = None
+        atexit.unregister(self.close)
+        self._raise_write_error()
+
+    def __enter__(self) -> JSONLLogger:
+        """Open the log file (if closed) and return the logger."""
+        self._open()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Flush and close the log file."""
+        self.close()
+
+    def _timestamp(self) -> str:
+        """Get current UTC timestamp in ISO 8601 format with microseconds."""
+        sec, ns = divmod(time.time_ns(), 1_000_000_000)
+        cached_sec, prefix = self._ts_cache
+        if sec != cached_sec:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+            self._ts_cache = (sec, prefix)
+        return f"{prefix}.{ns // 1000:06d}+00:00"
+
+    def _stamp(self) -> tuple[str, str | int, bytes]:
+        """Get the timestamp field for a new entry.
+
+        Returns:
+            Tuple of (field name, value, pre-encoded '{"<field>":<value>' entry head).
+        """
+        if self.ns_timestamps:
+            t = time.time_ns()
+            return "t", t, b'{"t":' + str(t).encode("ascii")
+        ts = self._timestamp()
+        return "timestamp", ts, b'{"timestamp":"' + ts.encode("ascii") + b'"'
 
     def _write_schema(self) -> None:
         """Write the log schema as the first entry."""
-        entry = {
-            "timestamp": datetime.now(UTC).isoformat(),
-            "action": "log_schema",
-            "schema": LOG_SCHEMA,
-        }
-        self._write_entry(entry, mode="w")
+        _, _, head = self._stamp()
+        self._write_bytes(head + b"," + _SCHEMA_TAIL + b"\n", flush=True)
 
     def log(self, action: str, **kwargs: Any) -> dict[str, Any]:
         """Log an action with timestamp.
@@ -97,12 +275,17 @@ class JSONLLogger:
             The complete log entry dict that was written.
 
         Raises:
-            OSError: If writing fails (disk full, permission denied, etc.).
+            OSError: If a FLUSH_ACTIONS entry (or an earlier queued one) cannot be written.
         """
-        entry = {
-            "timestamp": datetime.now(UTC).isoformat(),
-            "action": action,
-            **kwargs,
-        }
-        self._write_entry(entry)
+        key, stamp, head = self._stamp()
+        # One dict serves as both the serializer input and the return value;
+        # encoding it whole is faster than encoding kwargs and splicing bytes.
+        entry = {key: stamp, "action": action, **kwargs}
+        if not kwargs:
+            payload = head + (_ACTION_SUFFIX.get(action) or b',"action":' + _dumps(action) + b"}")
+        elif orjson is None and _encode_entry_fast is not None and not self.ns_timestamps:
+            payload = _encode_entry_fast(stamp, action, kwargs)
+        else:
+            payload = _dumps(entry)
+        self._write_bytes(payload + b"\n", flush=action in FLUSH_ACTIONS)
         return entry
@@ -5,16 +5,145 @@
 from __future__ import annotations
 
 import subprocess
+import tempfile
+import threading
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from scripts.common.logger import JSONLLogger
 
 
+# USB device listing used when IOKit is unavailable; "mini" skips per-device detail
+SYSTEM_PROFILER_CMD = ["system_profiler", "SPUSBDataType", "-detailLevel", "mini"]
+
+# Seconds to allow system_profiler before killing it
+SYSTEM_PROFILER_TIMEOUT_SEC = 10
+
+# Chunk size for streaming system_profiler output
+SYSTEM_PROFILER_CHUNK_SIZE = 4096
+
+# Absolute path to macOS `open`; subprocess only uses posix_spawn for a path-qualified executable
+OPEN_BIN = "/usr/bin/open"
+
+# Seconds to wait for `open` to hand an app off to LaunchServices
+LAUNCH_TIMEOUT_SEC = 10
+
+# Application names passed to `open -a`
+ABLETON_APP = "Ableton Live 12 Suite"
+QUICKTIME_APP = "QuickTime Player"
+CHROME_APP = "Google Chrome"
+
+# IOKit registry class for USB devices (IOUSBDevice is not published on Apple silicon)
+IOKIT_USB_DEVICE_CLASS = b"IOUSBHostDevice"
+
+# IOKit functions loaded through pyobjc, with their Objective-C type signatures
+_IOKIT_FUNCTIONS = [
+    ("IOServiceMatching", b"@r*"),
+    ("IOServiceGetMatchingServices", b"iI@o^I"),
+    ("IOIteratorNext", b"II"),
+    ("IORegistryEntryCreateCFProperty", b"@I@@I"),
+    ("IOObjectRelease", b"iI"),
+]
+
+
+def _usb_product_names() -> list[str] | None:
+    """List USB product names straight from the IOKit registry.
+
+    Avoids spawning system_profiler, which takes seconds and prints the whole
+    USB tree.
+
+    Returns:
+        Product names of connected USB devices, or None if pyobjc/IOKit is unavailable.
+    """
+    try:
+        import objc
+        from Foundation import NSBundle
+    except ImportError:
+        return None
+
+    iokit_bundle = NSBundle.bundleWithIdentifier_("com.apple.framework.IOKit")
+    if iokit_bundle is None:
+        return None
+    iokit: dict = {}
+    objc.loadBundleFunctions(iokit_bundle, iokit, _IOKIT_FUNCTIONS)
+
+    # kIOMainPortDefault is 0; the matching dictionary is consumed by the call
+    err, iterator = iokit["IOServiceGetMatchingServices"](0, iokit["IOServiceMatching"](IOKIT_USB_DEVICE_CLASS), None)
+    if err != 0:
+        return None
+
+    names: list[str] = []
+    try:
+        while device := iokit["IOIteratorNext"](iterator):
+            try:
+                name = iokit["IORegistryEntryCreateCFProperty"](device, "USB Product Name", None, 0)
+                if name:
+                    names.append(str(name))
+            finally:
+                iokit["IOObjectRelease"](device)
+    finally:
+        iokit["IOObjectRelease"](iterator)
+    return names
+
+
+def _system_profiler_lists(needle: str, timeout: float = SYSTEM_PROFILER_TIMEOUT_SEC) -> bool:
+    """Stream system_profiler's USB listing and stop at the first match.
+
+    Args:
+        needle: Substring to look for (e.g., "Launchpad").
+        timeout: Maximum seconds to let system_profiler run.
+
+    Returns:
+        True as soon as needle appears in the output, False if it never does.
+
+    Raises:
+        subprocess.TimeoutExpired: If system_profiler runs longer than timeout.
+        subprocess.CalledProcessError: If system_profiler exits non-zero without a match.
+    """
+    # stderr goes to a temporary file: a pipe nobody reads while stdout is
+    # streamed could fill up and stall system_profiler until the watchdog fires
+    with tempfile.TemporaryFile() as stderr_file:
+        proc = subprocess.Popen(SYSTEM_PROFILER_CMD, stdout=subprocess.PIPE, stderr=stderr_file)
+        timed_out = threading.Event()
+
+        def kill_on_timeout() -> None:
+            timed_out.set()
+            proc.kill()
+
+        watchdog = threading.Timer(timeout, kill_on_timeout)
+        watchdog.start()
+        try:
+            # Scan raw bytes (no decode); keep the last len(needle)-1 bytes so a
+            # match split across chunks is still found
+            needle_bytes = needle.encode("utf-8")
+            tail = b""
+            while chunk := proc.stdout.read1(SYSTEM_PROFILER_CHUNK_SIZE):
+                window = tail + chunk
+                if needle_bytes in window:
+                    return True
+                tail = window[-(len(needle_bytes) - 1) :]
+
+            proc.wait()
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(SYSTEM_PROFILER_CMD, timeout)
+            if proc.returncode != 0:
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode("utf-8", errors="replace")
+                raise subprocess.CalledProcessError(proc.returncode, SYSTEM_PROFILER_CMD, stderr=stderr)
+            return False
+        finally:
+            watchdog.cancel()
+            if proc.poll() is None:
+                proc.terminate()
+                proc.wait()
+            proc.stdout.close()
+
+
 def check_launchpad(logger: JSONLLogger) -> bool:
     """Check if Novation Launchpad is connected.
 
-    Checks both USB device list and MIDI ports for Launchpad detection.
+    Checks MIDI ports first, then the USB device list (via IOKit when pyobjc
+    is installed, otherwise via system_profiler).
 
     Args:
         logger: Logger instance for recording the check result.
@@ -36,24 +165,28 @@ def check_launchpad(logger: JSONLLogger) -> bool:
     except Exception as e:
         logger.log("launchpad_check", status="fallback", reason="midi_error", error=str(e))
 
-    # Fall back to USB device check
+    # Fall back to USB device check, natively through IOKit if possible
     try:
-        result = subprocess.run(
-            ["system_profiler", "SPUSBDataType"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        if result.returncode != 0:
-            error_msg = result.stderr.strip() if result.stderr else f"Exit code {result.returncode}"
-            logger.log("launchpad_check", status="error", error=error_msg)
-            return False
-        connected = "Launchpad" in result.stdout
+        product_names = _usb_product_names()
+    except Exception as e:
+        logger.log("launchpad_check", status="fallback", reason="iokit_error", error=str(e))
+        product_names = None
+    if product_names is not None:
+        connected = any("Launchpad" in name for name in product_names)
+        logger.log("launchpad_check", status="connected" if connected else "not_found", method="iokit")
+        return connected
+
+    try:
+        connected = _system_profiler_lists("Launchpad")
         logger.log("launchpad_check", status="connected" if connected else "not_found", method="usb")
         return connected
     except subprocess.TimeoutExpired:
         logger.log("launchpad_check", status="timeout")
         return False
+    except subprocess.CalledProcessError as e:
+        error_msg = e.stderr.strip() if e.stderr else f"Exit code {e.returncode}"
+        logger.log("launchpad_check", status="error", error=error_msg)
+        return False
     except (subprocess.SubprocessError, OSError) as e:
         logger.log("launchpad_check", status="error", error=str(e))
         return False
@@ -62,6 +195,8 @@ def check_launchpad(logger: JSONLLogger) -> bool:
 def _build_log_kwargs(app_name: str, url: str | None = None, error: str | None = None) -> dict:
     """Build log kwargs dict with optional url and error fields.
 
+    Used on the failure paths; the success path logs its fields inline.
+
     Args:
         app_name: Name of the application.
         url: Optional URL associated with the launch.
@@ -90,18 +225,20 @@ def _launch_app(app_name: str, logger: JSONLLogger, url: str | None = None) -> b
         True if launch command succeeded, False otherwise.
     """
     try:
-        cmd = ["open", "-a", app_name]
+        cmd = [OPEN_BIN, "-a", app_name]
         if url:
             cmd.append(url)
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+        # close_fds=False lets subprocess use posix_spawn instead of fork+exec;
+        # `open` prints nothing on success, so only stderr needs a pipe
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=LAUNCH_TIMEOUT_SEC, close_fds=False)
 
         if result.returncode != 0:
             error_msg = result.stderr.strip() or f"Exit code {result.returncode}"
             logger.log("app_launch_failed", **_build_log_kwargs(app_name, url, error_msg))
             return False
 
-        logger.log("app_launched", **_build_log_kwargs(app_name, url))
+        logger.log("app_launched", app=app_name, **({"url": url} if url else {}))
         return True
 
     except subprocess.TimeoutExpired:
@@ -121,7 +258,7 @@ def launch_ableton(logger: JSONLLogger) -> bool:
     Returns:
         True if launch command succeeded, False otherwise.
     """
-    return _launch_app("Ableton Live 12 Suite", logger)
+    return _launch_app(ABLETON_APP, logger)
 
 
 def launch_quicktime(logger: JSONLLogger) -> bool:
@@ -133,7 +270,7 @@ def launch_quicktime(logger: JSONLLogger) -> bool:
     Returns:
         True if launch command succeeded, False otherwise.
     """
-    return _launch_app("QuickTime Player", logger)
+    return _launch_app(QUICKTIME_APP, logger)
 
 
 def launch_chrome_to_url(url: str, logger: JSONLLogger) -> bool:
@@ -146,4 +283,4 @@ def launch_chrome_to_url(url: str, logger: JSONLLogger) -> bool:
     Returns:
         True if launch command succeeded, False otherwise.
     """
-    return _launch_app("Google Chrome", logger, url=url)
+    return _launch_app(CHROME_APP, logger, url=url)
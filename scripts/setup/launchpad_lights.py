@@ -11,9 +11,16 @@ Based on Novation Launchpad Mini MK3 Programmer's Reference Manual.
 
 from __future__ import annotations
 
+import collections
+import ctypes
+import ctypes.util
+import functools
+import heapq
 import random
+import sys
 import threading
 import time
+from collections.abc import Callable, Container, Iterable, Sequence
 from typing import TYPE_CHECKING
 
 try:
@@ -21,6 +28,12 @@ try:
 except ImportError:
     mido = None  # type: ignore[assignment]
 
+# python-rtmidi (mido's default backend); used to send raw bytes when available
+try:
+    import rtmidi
+except ImportError:
+    rtmidi = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from mido.ports import BaseOutput
 
@@ -29,6 +42,10 @@ if TYPE_CHECKING:
 # Launchpad Mini MK3 MIDI port name pattern
 LAUNCHPAD_PORT_PATTERN = "Launchpad Mini MK3"
 
+# Resolved MIDI port names by pattern, so reconnecting skips port enumeration
+# (slow on some backends, e.g. CoreMIDI with many virtual devices)
+_PORT_NAME_CACHE: dict[str, str] = {}
+
 # SysEx header for Launchpad Mini MK3 (manufacturer ID + device ID)
 SYSEX_HEADER = [0x00, 0x20, 0x29, 0x02, 0x0D]
 
@@ -48,6 +65,64 @@ PAD_GRID = [
     [11, 12, 13, 14, 15, 16, 17, 18],  # Bottom row
 ]
 
+# Grid pads flattened to index row * 8 + col (row 0 = top), and the reverse lookup.
+# Patterns draw into frame buffers indexed this way and _blit maps them to notes;
+# for single (row, col) lookups PAD_GRID[row][col] measures faster in CPython than
+# NOTE_LUT[(row << 3) | col] or the closed form 81 - 10 * row + col.
+NOTE_LUT = bytes(note for row in PAD_GRID for note in row)
+NOTE_INDEX = {note: i for i, note in enumerate(NOTE_LUT)}
+
+# Every LED cleared by _clear_all_leds: the 8x8 grid plus the top row buttons (91-98)
+ALL_NOTES = tuple(NOTE_LUT) + tuple(range(91, 99))
+
+# Flat grid indices on each square ring around the center, innermost first
+# (ring k holds pads whose Chebyshev distance from the center is k + 0.5).
+# Rings 4 and 5 are empty so _pattern_expand can let the last ring fade out.
+RINGS: tuple[tuple[int, ...], ...] = tuple(tuple(r * 8 + c for r in range(8) for c in range(8) if int(max(abs(r - 3.5), abs(c - 3.5))) == k) for k in range(6))
+
+
+def _spiral_order() -> tuple[int, ...]:
+    """Flat grid indices in clockwise spiral order from the top-left corner inward."""
+    spiral: list[int] = []
+    top, bottom, left, right = 0, 7, 0, 7
+    while top <= bottom and left <= right:
+        for c in range(left, right + 1):
+            spiral.append(top * 8 + c)
+        top += 1
+        for r in range(top, bottom + 1):
+            spiral.append(r * 8 + right)
+        right -= 1
+        if top <= bottom:
+            for c in range(right, left - 1, -1):
+                spiral.append(bottom * 8 + c)
+            bottom -= 1
+        if left <= right:
+            for r in range(bottom, top - 1, -1):
+                spiral.append(r * 8 + left)
+            left += 1
+    return tuple(spiral)
+
+
+# Traversal orders for the chase patterns, as flat grid indices
+SNAKE_ORDER = tuple(r * 8 + c for r in range(8) for c in (range(8) if r % 2 == 0 else range(7, -1, -1)))  # Boustrophedon
+SPIRAL_ORDER = _spiral_order()
+DIAGONALS = tuple(tuple(r * 8 + d - r for r in range(8) if 0 <= d - r < 8) for d in range(15))  # 15 anti-diagonals
+
+# LED lighting SysEx (command 0x03): one message carries up to 81 (type, LED, color) specs
+LED_SYSEX_COMMAND = 0x03
+LED_STATIC = 0
+LED_PULSE = 2
+
+# Start of every LED lighting SysEx message, up to the first (type, LED, color) spec
+LED_SYSEX_PREFIX = bytes([0xF0, *SYSEX_HEADER, LED_SYSEX_COMMAND])
+
+# Payload that turns every LED off. The Mini MK3 has no dedicated "clear all" SysEx
+# (0x0E selects Programmer/Live mode), so this is a full 72-spec lighting message.
+CLEAR_ALL_SYSEX = [LED_SYSEX_COMMAND] + [value for note in ALL_NOTES for value in (LED_STATIC, note, 0)]
+
+# The same message framed as raw MIDI bytes (F0 ... F7), sent as-is on rtmidi ports
+CLEAR_ALL_MESSAGE = bytes([0xF0, *SYSEX_HEADER, *CLEAR_ALL_SYSEX, 0xF7])
+
 # Snake colors: gradient from bright white head to bright red tail (length=5)
 # Based on Launchpad Mini MK3 palette (page 11 of Programmer's Reference):
 #   Row 0 (0-7): off, grays, white, pinks
@@ -64,6 +139,10 @@ WARM_COLORS = [
 # Animation speed (seconds between frames)
 CHASE_SPEED = 0.08
 
+# Final stretch of each frame wait that is spun rather than slept, since sleep
+# wakeups can overshoot by about a millisecond
+PACE_SPIN_SEC = 0.001
+
 # How long each pattern runs before switching (seconds)
 PATTERN_DURATION = 8
 
@@ -121,6 +200,154 @@ DOT_FORBIDDEN = {
     (6, 7),  # BR corner
 }
 
+# Every (row, col) on the grid, row-major
+GRID_POSITIONS = tuple((r, c) for r in range(8) for c in range(8))
+
+# Cells the dot may occupy, and for each grid index the cells one DOT_DIRS step away
+# (clamped to the grid, in DOT_DIRS order, excluding the cell itself and forbidden
+# corners). Duplicates from clamping are kept so edge moves stay weighted as before.
+DOT_CELLS = tuple(pos for pos in GRID_POSITIONS if pos not in DOT_FORBIDDEN)
+DOT_MOVES = tuple(
+    tuple(target for target in ((max(0, min(7, r + dr)), max(0, min(7, c + dc))) for dr, dc in DOT_DIRS) if target != (r, c) and target not in DOT_FORBIDDEN)
+    for r, c in GRID_POSITIONS
+)
+
+
+def _pace(deadline: float, period: float, stop: threading.Event | None = None) -> float:
+    """Sleep until the next frame deadline on a fixed cadence.
+
+    Advancing the deadline by a fixed period (rather than sleeping a fixed
+    time after drawing) keeps the frame rate steady regardless of how long
+    the frame took to send. The wait sleeps until PACE_SPIN_SEC before the
+    deadline and spins the rest, so frames land within a fraction of a
+    millisecond of it. The returned deadline doubles as the current frame's
+    timestamp, so pattern loops need no further clock reads.
+
+    Args:
+        deadline: Monotonic time the current frame was due.
+        period: Seconds between frames.
+        stop: If given, wait on this event instead of sleeping so that setting
+            it ends the wait immediately.
+
+    Returns:
+        Monotonic time the next frame is due.
+    """
+    deadline += period
+    remaining = deadline - time.monotonic()
+    if remaining < -period:
+        # Fell more than a frame behind; resync instead of rushing to catch up
+        return time.monotonic()
+    if remaining > PACE_SPIN_SEC:
+        if stop is not None:
+            stop.wait(remaining - PACE_SPIN_SEC)
+        else:
+            time.sleep(remaining - PACE_SPIN_SEC)
+    while time.monotonic() < deadline:
+        if stop is not None and stop.is_set():
+            break
+    return deadline
+
+
+# Trail lengths of the snake and spiral chases
+SNAKE_TRAIL_LENGTH = 8
+SPIRAL_TRAIL_LENGTH = 10
+
+# Trail colors (head first) for each starting color index of the snake and spiral chases
+SNAKE_TRAIL_COLORS = tuple(tuple(WARM_COLORS[(c + o) % len(WARM_COLORS)] for o in range(SNAKE_TRAIL_LENGTH)) for c in range(len(WARM_COLORS)))
+SPIRAL_TRAIL_COLORS = tuple(tuple(ALL_COLORS[(c + o) % len(ALL_COLORS)] for o in range(SPIRAL_TRAIL_LENGTH)) for c in range(len(ALL_COLORS)))
+
+# macOS QoS class for work the user is actively watching (sys/qos.h)
+QOS_CLASS_USER_INTERACTIVE = 0x21
+
+
+def raise_thread_priority() -> bool:
+    """Ask the OS to schedule the calling thread ahead of background work.
+
+    On macOS this sets the thread's QoS class to USER_INTERACTIVE, which keeps
+    animation frames on time while Ableton, Chrome and QuickTime are busy.
+    Other platforms need elevated privileges for real-time threads, so this
+    is a no-op there.
+
+    Returns:
+        True if the priority was raised, False otherwise.
+    """
+    if sys.platform != "darwin":
+        return False
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"))
+        return libc.pthread_set_qos_class_self_np(QOS_CLASS_USER_INTERACTIVE, 0) == 0
+    except (OSError, AttributeError):
+        return False
+
+
+# Deterministic patterns draw from a small set of frames; each is built once on
+# first use and returned as immutable (frame, pulse) bytes for _blit.
+
+
+def _chase_frame(order: tuple[int, ...], trail_colors: tuple[int, ...], head_pos: int) -> tuple[bytes, bytes]:
+    """Frame for a chase along order: pulsing head at head_pos trailed by trail_colors."""
+    frame, pulse = bytearray(64), bytearray(64)
+    for offset, color in enumerate(trail_colors):
+        pos = head_pos - offset
+        if 0 <= pos < len(order):
+            frame[order[pos]] = color
+            pulse[order[pos]] = offset == 0
+    return bytes(frame), bytes(pulse)
+
+
+@functools.cache
+def _snake_frame(head_pos: int, color_index: int) -> tuple[bytes, bytes]:
+    """Frame for _pattern_snake."""
+    return _chase_frame(SNAKE_ORDER, SNAKE_TRAIL_COLORS[color_index], head_pos)
+
+
+@functools.cache
+def _spiral_frame(head_pos: int, color_index: int) -> tuple[bytes, bytes]:
+    """Frame for _pattern_spiral."""
+    return _chase_frame(SPIRAL_ORDER, SPIRAL_TRAIL_COLORS[color_index], head_pos)
+
+
+@functools.cache
+def _wave_frame(wave_pos: int, color_index: int) -> tuple[bytes, bytes]:
+    """Frame for _pattern_wave: three lit columns ending at wave_pos, leading column pulsing."""
+    frame, pulse = bytearray(64), bytearray(64)
+    for offset in range(3):
+        col = (wave_pos - offset) % 8
+        color = WARM_COLORS[(color_index + offset) % len(WARM_COLORS)]
+        for row in range(8):
+            frame[row * 8 + col] = color
+            pulse[row * 8 + col] = offset == 0
+    return bytes(frame), bytes(pulse)
+
+
+@functools.cache
+def _diagonal_frame(i: int, color_index: int) -> tuple[bytes, bytes]:
+    """Frame for _pattern_diagonal: pulsing diagonal i trailed by the two before it."""
+    frame, pulse = bytearray(64), bytearray(64)
+    color = ALL_COLORS[(color_index + i) % len(ALL_COLORS)]
+    for idx in DIAGONALS[i]:
+        frame[idx] = color
+        pulse[idx] = 1
+    for trail in range(1, 3):
+        if i - trail >= 0:
+            trail_color = WARM_COLORS[(color_index + i - trail) % len(WARM_COLORS)]
+            for idx in DIAGONALS[i - trail]:
+                frame[idx] = trail_color
+    return bytes(frame), bytes(pulse)
+
+
+@functools.cache
+def _expand_frame(radius: int, color: int, trail_color: int) -> tuple[bytes, bytes]:
+    """Frame for _pattern_expand: pulsing ring at radius trailed by the previous ring."""
+    frame, pulse = bytearray(64), bytearray(64)
+    for idx in RINGS[radius]:
+        frame[idx] = color
+        pulse[idx] = 1
+    if radius > 0:
+        for idx in RINGS[radius - 1]:
+            frame[idx] = trail_color
+    return bytes(frame), bytes(pulse)
+
 
 class LaunchpadLights:
     """Controls Launchpad Mini MK3 LED patterns for cat attraction.
@@ -138,18 +365,38 @@ class LaunchpadLights:
         """
         self.logger = logger
         self._outport: BaseOutput | None = None
-        self._running = False
+        # Set while stopped; patterns wait on it between frames so stop() wakes them at once
+        self._stop_event = threading.Event()
+        self._stop_event.set()
         self._thread: threading.Thread | None = None
+        # Private generator so pattern threads don't share the module-level random state
+        self._rng = random.Random()
+        # Note On messages by (note, velocity, channel); building a mido.Message validates every field
+        self._note_messages: dict[tuple[int, int, int], mido.Message] = {}
+        # rtmidi send_message of the open port, which takes raw MIDI bytes and skips
+        # mido.Message construction; None when the port is not an rtmidi port
+        self._send_raw: Callable[[Sequence[int]], None] | None = None
+        # Last color and pulse flag sent to each grid pad (indexed like NOTE_LUT)
+        self._frame = bytearray(64)
+        self._pulse = bytearray(64)
+        # Reused LED lighting SysEx message that _blit fills in place (room for every grid pad + F7)
+        self._led_sysex = bytearray(LED_SYSEX_PREFIX) + bytearray(3 * 64 + 1)
+        # False only while every LED is known to be off, so repeated clears send nothing;
+        # starts True because a freshly connected device may still show anything
+        self._leds_dirty = True
 
     @property
     def running(self) -> bool:
         """Whether the light pattern is currently running."""
-        return self._running
+        return not self._stop_event.is_set()
 
     @running.setter
     def running(self, value: bool) -> None:
         """Set the running state."""
-        self._running = value
+        if value:
+            self._stop_event.clear()
+        else:
+            self._stop_event.set()
 
     def enter_programmer_mode(self) -> None:
         """Enter programmer mode for full LED control (public wrapper)."""
@@ -210,6 +457,17 @@ class LaunchpadLights:
             self._log("launchpad_lights", status="error", error="mido library not installed")
             return False
 
+        cached_port = _PORT_NAME_CACHE.get(LAUNCHPAD_PORT_PATTERN)
+        if cached_port is not None:
+            try:
+                self._outport = mido.open_output(cached_port)
+                self._bind_raw_send()
+                self._log("launchpad_lights", status="connected", port=cached_port)
+                return True
+            except (OSError, ValueError, RuntimeError):
+                # Port went away or was renamed; fall back to enumerating once
+                _PORT_NAME_CACHE.pop(LAUNCHPAD_PORT_PATTERN, None)
+
         try:
             # Find Launchpad MIDI output port (use MIDI port, not DAW port)
             output_names = mido.get_output_names()
@@ -224,6 +482,8 @@ class LaunchpadLights:
                 return False
 
             self._outport = mido.open_output(launchpad_port)
+            self._bind_raw_send()
+            _PORT_NAME_CACHE[LAUNCHPAD_PORT_PATTERN] = launchpad_port
             self._log("launchpad_lights", status="connected", port=launchpad_port)
             return True
 
@@ -231,6 +491,14 @@ class LaunchpadLights:
             self._log("launchpad_lights", status="error", error=str(e))
             return False
 
+    def _bind_raw_send(self) -> None:
+        """Use the rtmidi handle behind the open mido port for sends, if there is one."""
+        handle = getattr(self._outport, "_rt", None)
+        if rtmidi is not None and isinstance(handle, rtmidi.MidiOut):
+            self._send_raw = handle.send_message
+        else:
+            self._send_raw = None
+
     def disconnect(self) -> None:
         """Disconnect from the Launchpad and reset to default state."""
         self.stop()
@@ -242,6 +510,13 @@ class LaunchpadLights:
             except (OSError, ValueError):
                 pass  # Ignore cleanup errors during disconnect; port may already be closed
             self._outport = None
+            self._send_raw = None
+            self._leds_dirty = True
+        if self.logger:
+            try:
+                self.logger.flush()
+            except OSError:
+                pass  # The logger already reported the write error on stderr
 
     def _send_sysex(self, data: list[int]) -> None:
         """Send a SysEx message to the Launchpad.
@@ -249,7 +524,9 @@ class LaunchpadLights:
         Args:
             data: SysEx data bytes (without F0 header or F7 terminator).
         """
-        if self._outport:
+        if self._send_raw is not None:
+            self._send_raw([0xF0, *SYSEX_HEADER, *data, 0xF7])
+        elif self._outport:
             msg = mido.Message("sysex", data=SYSEX_HEADER + data)
             self._outport.send(msg)
 
@@ -261,8 +538,13 @@ class LaunchpadLights:
             velocity: Color index from palette (0-127).
             channel: MIDI channel (0=static, 1=flash, 2=pulse).
         """
-        if self._outport:
-            msg = mido.Message("note_on", note=note, velocity=velocity, channel=channel)
+        if self._send_raw is not None:
+            self._send_raw((0x90 | channel, note, velocity))
+        elif self._outport:
+            key = (note, velocity, channel)
+            msg = self._note_messages.get(key)
+            if msg is None:
+                msg = self._note_messages[key] = mido.Message("note_on", note=note, velocity=velocity, channel=channel)
             self._outport.send(msg)
 
     def _enter_programmer_mode(self) -> None:
@@ -276,13 +558,19 @@ class LaunchpadLights:
         self._send_sysex([0x00, 0x00])
 
     def _clear_all_leds(self) -> None:
-        """Turn off all LEDs on the grid."""
-        for row in PAD_GRID:
-            for note in row:
-                self._send_note_on(note, 0)
-        # Also clear top row buttons (91-98)
-        for note in range(91, 99):
-            self._send_note_on(note, 0)
+        """Turn off all LEDs on the grid and top row with one SysEx message.
+
+        Does nothing if no LED has been lit since the last clear.
+        """
+        if not self._leds_dirty:
+            return
+        if self._send_raw is not None:
+            self._send_raw(CLEAR_ALL_MESSAGE)
+        else:
+            self._send_sysex(CLEAR_ALL_SYSEX)
+        self._frame[:] = bytes(64)
+        self._pulse[:] = bytes(64)
+        self._leds_dirty = False
 
     def _set_led(self, note: int, color: int, pulse: bool = False) -> None:
         """Set an LED to a specific color.
@@ -294,70 +582,124 @@ class LaunchpadLights:
         """
         channel = 2 if pulse else 0  # Channel 2 = pulsing, Channel 0 = static
         self._send_note_on(note, color, channel)
+        if color:
+            self._leds_dirty = True
+        idx = NOTE_INDEX.get(note)
+        if idx is not None:
+            self._frame[idx] = color
+            self._pulse[idx] = pulse and color != 0
+
+    def _blit(self, frame: bytes, pulse: bytes, cells: Iterable[int] | None = None) -> None:
+        """Show a full grid frame, updating only pads that changed in one SysEx.
+
+        Args:
+            frame: Color index for each grid pad (indexed like NOTE_LUT, 0 = off).
+            pulse: 1 for pads that should pulse, 0 for static.
+            cells: If given, the only grid indices that may differ from what is
+                shown; the rest of the frame is not compared.
+        """
+        shown, shown_pulse = self._frame, self._pulse
+        buf = self._led_sysex
+        n = len(LED_SYSEX_PREFIX)
+        if cells is not None:
+            for i in cells:
+                color, is_pulse = frame[i], pulse[i]
+                if color != shown[i] or is_pulse != shown_pulse[i]:
+                    buf[n] = LED_PULSE if is_pulse else LED_STATIC
+                    buf[n + 1] = NOTE_LUT[i]
+                    buf[n + 2] = color
+                    n += 3
+                    shown[i], shown_pulse[i] = color, is_pulse
+            if n > len(LED_SYSEX_PREFIX):
+                self._send_led_sysex(n)
+            return
+        if frame == shown and pulse == shown_pulse:
+            return  # Nothing moved (most hunt ticks)
+        for i, (color, old_color, is_pulse, was_pulse) in enumerate(zip(frame, shown, pulse, shown_pulse, strict=True)):
+            if color != old_color or is_pulse != was_pulse:
+                buf[n] = LED_PULSE if is_pulse else LED_STATIC
+                buf[n + 1] = NOTE_LUT[i]
+                buf[n + 2] = color
+                n += 3
+        self._send_led_sysex(n)
+        shown[:] = frame
+        shown_pulse[:] = pulse
+
+    def _send_led_sysex(self, end: int) -> None:
+        """Terminate the LED SysEx buffer after its specs and send it.
+
+        Args:
+            end: Offset just past the last (type, LED, color) spec in the buffer.
+        """
+        buf = self._led_sysex
+        buf[end] = 0xF7
+        self._leds_dirty = True
+        if self._send_raw is not None:
+            self._send_raw(buf[: end + 1])
+        elif self._outport:
+            self._outport.send(mido.Message("sysex", data=buf[1:end]))
 
     def _pattern_snake(self, duration: float) -> None:
         """Snake chase pattern - lights chase in a snake across the grid."""
-        snake_order = []
-        for i, row in enumerate(PAD_GRID):
-            if i % 2 == 0:
-                snake_order.extend(row)
-            else:
-                snake_order.extend(reversed(row))
-
-        trail_length = 8
         color_index = 0
-        end_time = time.time() + duration
-
-        while self._running and time.time() < end_time:
-            for head_pos in range(len(snake_order) + trail_length):
-                if not self._running or time.time() >= end_time:
+        deadline = time.monotonic()
+        end_time = deadline + duration
+        stop, blit = self._stop_event, self._blit
+        stopped = stop.is_set
+        steps = range(len(SNAKE_ORDER) + SNAKE_TRAIL_LENGTH)
+        n_colors = len(WARM_COLORS)
+
+        while not stopped() and deadline < end_time:
+            for head_pos in steps:
+                if stopped() or deadline >= end_time:
                     break
-                self._clear_all_leds()
-                for trail_offset in range(trail_length):
-                    pos = head_pos - trail_offset
-                    if 0 <= pos < len(snake_order):
-                        color_idx = (color_index + trail_offset) % len(WARM_COLORS)
-                        pulse = trail_offset == 0
-                        self._set_led(snake_order[pos], WARM_COLORS[color_idx], pulse)
-                time.sleep(CHASE_SPEED)
-            color_index = (color_index + 1) % len(WARM_COLORS)
+                blit(*_snake_frame(head_pos, color_index))
+                deadline = _pace(deadline, CHASE_SPEED, stop)
+            color_index = (color_index + 1) % n_colors
 
     def _pattern_sparkle(self, duration: float) -> None:
         """Random sparkle pattern - random pads flash like fireflies."""
-        end_time = time.time() + duration
-        active_pads: dict[int, float] = {}  # note -> expire_time
-
-        while self._running and time.time() < end_time:
-            now = time.time()
+        deadline = time.monotonic()
+        end_time = deadline + duration
+        # Lit pads as a min-heap of (expire_time, grid index); a pad is lit while its frame color is non-zero
+        expiries: list[tuple[float, int]] = []
+        frame, pulse = bytearray(64), bytearray(64)
+        rnd, randrange, choice, uniform = self._rng.random, self._rng.randrange, self._rng.choice, self._rng.uniform
+        heappop, heappush = heapq.heappop, heapq.heappush
+        stop, blit = self._stop_event, self._blit
+        stopped = stop.is_set
+
+        while not stopped() and deadline < end_time:
             # Remove expired pads
-            expired = [n for n, exp in active_pads.items() if now >= exp]
-            for note in expired:
-                self._set_led(note, 0)
-                del active_pads[note]
+            while expiries and expiries[0][0] <= deadline:
+                _, idx = heappop(expiries)
+                frame[idx] = pulse[idx] = 0
 
             # Add new random pads
-            if len(active_pads) < 12 and random.random() > 0.3:
-                row = random.choice(PAD_GRID)
-                note = random.choice(row)
-                if note not in active_pads:
-                    color = random.choice(ALL_COLORS)
-                    pulse = random.random() > 0.5
-                    self._set_led(note, color, pulse)
-                    active_pads[note] = now + random.uniform(0.2, 0.8)
+            if len(expiries) < 12 and rnd() > 0.3:
+                idx = randrange(64)
+                if not frame[idx]:
+                    frame[idx] = choice(ALL_COLORS)
+                    pulse[idx] = rnd() > 0.5
+                    heappush(expiries, (deadline + uniform(0.2, 0.8), idx))
 
-            time.sleep(0.05)
+            blit(frame, pulse)
+            deadline = _pace(deadline, 0.05, stop)
 
         # Clear remaining
-        for note in active_pads:
-            self._set_led(note, 0)
+        self._blit(bytearray(64), bytearray(64))
 
     def _pattern_rain(self, duration: float) -> None:
         """Rain pattern - drops fall from top to bottom."""
-        end_time = time.time() + duration
+        deadline = time.monotonic()
+        end_time = deadline + duration
         drops: list[tuple[int, int, int]] = []  # (col, row, color)
+        rnd, randrange, choice = self._rng.random, self._rng.randrange, self._rng.choice
+        stop, blit = self._stop_event, self._blit
+        stopped = stop.is_set
 
-        while self._running and time.time() < end_time:
-            self._clear_all_leds()
+        while not stopped() and deadline < end_time:
+            frame, pulse = bytearray(64), bytearray(64)
 
             # Move drops down
             new_drops = []
@@ -365,131 +707,93 @@ class LaunchpadLights:
                 new_row = row + 1
                 if new_row < 8:
                     new_drops.append((col, new_row, color))
-                    self._set_led(PAD_GRID[new_row][col], color)
+                    frame[new_row * 8 + col] = color
             drops = new_drops
 
             # Add new drops at top
-            if random.random() > 0.5:
-                col = random.randint(0, 7)
-                color = random.choice(WARM_COLORS)
+            if rnd() > 0.5:
+                col = randrange(8)
+                color = choice(WARM_COLORS)
                 drops.append((col, 0, color))
-                self._set_led(PAD_GRID[0][col], color, pulse=True)
+                frame[col] = color
+                pulse[col] = 1
 
-            time.sleep(0.12)
+            blit(frame, pulse)
+            deadline = _pace(deadline, 0.12, stop)
 
     def _pattern_spiral(self, duration: float) -> None:
         """Spiral pattern - lights spiral from outside to center."""
-        # Create spiral order
-        spiral = []
-        top, bottom, left, right = 0, 7, 0, 7
-        while top <= bottom and left <= right:
-            for c in range(left, right + 1):
-                spiral.append(PAD_GRID[top][c])
-            top += 1
-            for r in range(top, bottom + 1):
-                spiral.append(PAD_GRID[r][right])
-            right -= 1
-            if top <= bottom:
-                for c in range(right, left - 1, -1):
-                    spiral.append(PAD_GRID[bottom][c])
-                bottom -= 1
-            if left <= right:
-                for r in range(bottom, top - 1, -1):
-                    spiral.append(PAD_GRID[r][left])
-                left += 1
-
-        trail_length = 10
         color_index = 0
-        end_time = time.time() + duration
-
-        while self._running and time.time() < end_time:
-            for head_pos in range(len(spiral) + trail_length):
-                if not self._running or time.time() >= end_time:
+        deadline = time.monotonic()
+        end_time = deadline + duration
+        stop, blit = self._stop_event, self._blit
+        stopped = stop.is_set
+        steps = range(len(SPIRAL_ORDER) + SPIRAL_TRAIL_LENGTH)
+        n_colors = len(ALL_COLORS)
+
+        while not stopped() and deadline < end_time:
+            for head_pos in steps:
+                if stopped() or deadline >= end_time:
                     break
-                self._clear_all_leds()
-                for trail_offset in range(trail_length):
-                    pos = head_pos - trail_offset
-                    if 0 <= pos < len(spiral):
-                        color_idx = (color_index + trail_offset) % len(ALL_COLORS)
-                        self._set_led(spiral[pos], ALL_COLORS[color_idx], trail_offset == 0)
-                time.sleep(CHASE_SPEED)
-            color_index = (color_index + 2) % len(ALL_COLORS)
+                blit(*_spiral_frame(head_pos, color_index))
+                deadline = _pace(deadline, CHASE_SPEED, stop)
+            color_index = (color_index + 2) % n_colors
 
     def _pattern_wave(self, duration: float) -> None:
         """Wave pattern - horizontal waves sweep across."""
-        end_time = time.time() + duration
+        deadline = time.monotonic()
+        end_time = deadline + duration
         wave_pos = 0
         color_index = 0
+        stop, blit = self._stop_event, self._blit
+        stopped = stop.is_set
+        n_colors = len(WARM_COLORS)
 
-        while self._running and time.time() < end_time:
-            self._clear_all_leds()
+        while not stopped() and deadline < end_time:
             # Light up columns based on wave position
-            for offset in range(3):
-                col = (wave_pos - offset) % 8
-                for row in range(8):
-                    color = WARM_COLORS[(color_index + offset) % len(WARM_COLORS)]
-                    self._set_led(PAD_GRID[row][col], color, offset == 0)
+            blit(*_wave_frame(wave_pos, color_index))
 
             wave_pos = (wave_pos + 1) % 8
             if wave_pos == 0:
-                color_index = (color_index + 1) % len(WARM_COLORS)
-            time.sleep(0.1)
+                color_index = (color_index + 1) % n_colors
+            deadline = _pace(deadline, 0.1, stop)
 
     def _pattern_diagonal(self, duration: float) -> None:
         """Diagonal chase pattern - lights move diagonally."""
-        diagonals = []
-        for d in range(15):  # 15 diagonals in 8x8 grid
-            diag = []
-            for r in range(8):
-                c = d - r
-                if 0 <= c < 8:
-                    diag.append(PAD_GRID[r][c])
-            if diag:
-                diagonals.append(diag)
-
-        end_time = time.time() + duration
+        deadline = time.monotonic()
+        end_time = deadline + duration
         color_index = 0
-
-        while self._running and time.time() < end_time:
-            for i, diag in enumerate(diagonals):
-                if not self._running or time.time() >= end_time:
+        stop, blit = self._stop_event, self._blit
+        stopped = stop.is_set
+        steps = range(len(DIAGONALS))
+        n_colors = len(ALL_COLORS)
+
+        while not stopped() and deadline < end_time:
+            for i in steps:
+                if stopped() or deadline >= end_time:
                     break
-                self._clear_all_leds()
-                color = ALL_COLORS[(color_index + i) % len(ALL_COLORS)]
-                for note in diag:
-                    self._set_led(note, color, True)
-                # Also show trailing diagonals
-                for trail in range(1, 3):
-                    if i - trail >= 0:
-                        trail_color = WARM_COLORS[(color_index + i - trail) % len(WARM_COLORS)]
-                        for note in diagonals[i - trail]:
-                            self._set_led(note, trail_color)
-                time.sleep(0.08)
-            color_index = (color_index + 1) % len(ALL_COLORS)
+                blit(*_diagonal_frame(i, color_index))
+                deadline = _pace(deadline, 0.08, stop)
+            color_index = (color_index + 1) % n_colors
 
     def _pattern_expand(self, duration: float) -> None:
         """Expanding rings from center."""
-        end_time = time.time() + duration
+        deadline = time.monotonic()
+        end_time = deadline + duration
         color_index = 0
+        stop, blit = self._stop_event, self._blit
+        stopped = stop.is_set
+        n_colors, n_warm = len(ALL_COLORS), len(WARM_COLORS)
 
-        while self._running and time.time() < end_time:
+        while not stopped() and deadline < end_time:
+            color = ALL_COLORS[color_index]
+            trail_color = WARM_COLORS[color_index % n_warm]
             for radius in range(6):
-                if not self._running or time.time() >= end_time:
+                if stopped() or deadline >= end_time:
                     break
-                self._clear_all_leds()
-                color = ALL_COLORS[color_index % len(ALL_COLORS)]
-
-                # Draw ring at current radius
-                for r in range(8):
-                    for c in range(8):
-                        dist = max(abs(r - 3.5), abs(c - 3.5))
-                        if radius <= dist < radius + 1:
-                            self._set_led(PAD_GRID[r][c], color, True)
-                        elif radius - 1 <= dist < radius:
-                            self._set_led(PAD_GRID[r][c], WARM_COLORS[color_index % len(WARM_COLORS)])
-
-                time.sleep(0.15)
-            color_index = (color_index + 1) % len(ALL_COLORS)
+                blit(*_expand_frame(radius, color, trail_color))
+                deadline = _pace(deadline, 0.15, stop)
+            color_index = (color_index + 1) % n_colors
 
     def _pattern_hunt(self, duration: float) -> None:
         """Snake hunts dot pattern - Nerys's favorite!
@@ -502,205 +806,189 @@ class LaunchpadLights:
         - When snake catches dot, new dot spawns
         - Snake length is fixed (doesn't grow)
         """
-        end_time = time.time() + duration
+        now = time.monotonic()
+        end_time = now + duration
         snake_length = 5
         snake_speed = 0.135  # seconds per move
         dot_speed = 0.15  # seconds per move (~10s avg chase)
 
-        # Initialize snake in center, moving right
-        snake: list[tuple[int, int]] = [(3, 3 - i) for i in range(snake_length)]
+        # Initialize snake in center, moving right. Cells are flat grid indices
+        # (row << 3 | col), head first, mirrored in a set for membership tests.
+        snake = collections.deque((3 << 3) | (3 - i) for i in range(snake_length))
+        snake_cells = set(snake)
         snake_dir = (0, 1)  # moving right
 
         # Spawn dot away from snake
         dot = self._spawn_dot_away_from(snake)
         dot_color_idx = 0
 
-        last_snake_move = time.time()
-        last_dot_move = time.time()
+        # Frame kept across moves; only the previous and current snake/dot cells can change
+        frame, pulse = bytearray(64), bytearray(64)
+        drawn: list[int] = []
+        snake_colors = [WARM_COLORS[i % len(WARM_COLORS)] for i in range(snake_length)]
+        blit, monotonic = self._blit, time.monotonic
+        stopped, wait = self._stop_event.is_set, self._stop_event.wait
+        blit(frame, pulse)
 
-        while self._running and time.time() < end_time:
-            now = time.time()
+        next_snake_move = now + snake_speed
+        next_dot_move = now + dot_speed
 
+        while not stopped() and now < end_time:
             # Move snake
-            if now - last_snake_move >= snake_speed:
+            if now >= next_snake_move:
+                head = (snake[0] >> 3, snake[0] & 7)
                 # Choose direction toward dot
-                snake_dir = self._choose_snake_direction(snake[0], dot, snake_dir, snake)
-                # Move head (NO wrapping - stay on square)
-                new_r = snake[0][0] + snake_dir[0]
-                new_c = snake[0][1] + snake_dir[1]
-                # Clamp to grid bounds
-                new_r = max(0, min(7, new_r))
-                new_c = max(0, min(7, new_c))
-                new_head = (new_r, new_c)
-                # Only move if not hitting own body
-                if new_head not in snake[1:]:
-                    snake = [new_head] + snake[:-1]
-                last_snake_move = now
+                snake_dir = self._choose_snake_direction(head, dot, snake_dir, snake_cells)
+                # Move head (NO wrapping - stay on square), clamped to grid bounds
+                new_r = max(0, min(7, head[0] + snake_dir[0]))
+                new_c = max(0, min(7, head[1] + snake_dir[1]))
+                new_head = (new_r << 3) | new_c
+                # Only move if not hitting own body; the tail retracts as the head advances
+                if new_head not in snake_cells:
+                    snake_cells.discard(snake.pop())
+                    snake.appendleft(new_head)
+                    snake_cells.add(new_head)
+                next_snake_move = now + snake_speed
 
                 # Check if caught dot
-                if snake[0] == dot:
+                if snake[0] == (dot[0] << 3) | dot[1]:
                     dot = self._spawn_dot_away_from(snake)
-                    # Ensure new color is different from current (if multiple colors available)
+                    # Pick a new color different from the current one (if multiple colors available)
                     if len(COOL_COLORS) > 1:
-                        old_color_idx = dot_color_idx
-                        while dot_color_idx == old_color_idx:
-                            dot_color_idx = random.randint(0, len(COOL_COLORS) - 1)
+                        dot_color_idx = (dot_color_idx + 1 + self._rng.randrange(len(COOL_COLORS) - 1)) % len(COOL_COLORS)
 
             # Move dot (half as often)
-            if now - last_dot_move >= dot_speed:
-                dot = self._move_dot_away(dot, snake[0])
-                last_dot_move = now
-
-            # Draw
-            self._clear_all_leds()
+            if now >= next_dot_move:
+                dot = self._move_dot_away(dot, (snake[0] >> 3, snake[0] & 7))
+                next_dot_move = now + dot_speed
+
+            # Draw: erase last move's cells, then paint the snake and dot
+            for idx in drawn:
+                frame[idx] = pulse[idx] = 0
+            dot_idx = (dot[0] << 3) | dot[1]
+            changed = set(drawn)
+            drawn = [*snake, dot_idx]
+            changed.update(drawn)
 
             # Draw snake with warm color gradient
-            for i, (r, c) in enumerate(snake):
-                color = WARM_COLORS[i % len(WARM_COLORS)]
-                pulse = i == 0  # Head pulses
-                self._set_led(PAD_GRID[r][c], color, pulse)
+            for idx, color in zip(snake, snake_colors, strict=True):
+                frame[idx] = color
+            pulse[snake[0]] = 1  # Head pulses
 
             # Draw dot with cool color (pulsing)
-            dr, dc = dot
-            self._set_led(PAD_GRID[dr][dc], COOL_COLORS[dot_color_idx], pulse=True)
+            frame[dot_idx] = COOL_COLORS[dot_color_idx]
+            pulse[dot_idx] = 1
+
+            blit(frame, pulse, changed)
+
+            # Sleep until the next move is due rather than polling
+            next_event = min(next_snake_move, next_dot_move, end_time)
+            sleep_for = next_event - monotonic()
+            if sleep_for > 0:
+                wait(sleep_for)
+            now = monotonic()
+
+    def _spawn_dot_away_from(self, snake: Sequence[int]) -> tuple[int, int]:
+        """Spawn dot at random position not occupied by snake or forbidden.
 
-            time.sleep(0.03)
+        Open cells at least 3 steps from the snake head are twice as likely to
+        be picked as nearer ones.
 
-    def _spawn_dot_away_from(self, snake: list[tuple[int, int]]) -> tuple[int, int]:
-        """Spawn dot at random position not occupied by snake or forbidden."""
+        Args:
+            snake: Snake cells as flat grid indices (row << 3 | col), head first.
+        """
         snake_set = set(snake)
-        head = snake[0]
-        max_attempts = 100
-
-        # Try a bounded number of random placements first
-        for _ in range(max_attempts):
-            r, c = random.randint(0, 7), random.randint(0, 7)
-            if (r, c) not in snake_set and (r, c) not in DOT_FORBIDDEN:
-                # Prefer positions far from snake head
-                dist = abs(r - head[0]) + abs(c - head[1])
-                if dist >= 3 or random.random() > 0.5:
-                    return (r, c)
-
-        # Fallback: deterministically choose a valid cell, preferring farthest from head
-        candidates: list[tuple[int, int]] = []
-        for r in range(8):
-            for c in range(8):
-                if (r, c) not in snake_set and (r, c) not in DOT_FORBIDDEN:
-                    candidates.append((r, c))
-
-        if candidates:
-            # Choose the candidate farthest from the snake head (maximizing Manhattan distance)
-            return max(
-                candidates,
-                key=lambda pos: abs(pos[0] - head[0]) + abs(pos[1] - head[1]),
-            )
+        hr, hc = snake[0] >> 3, snake[0] & 7
+
+        open_cells = [(r, c) for r, c in DOT_CELLS if (r << 3) | c not in snake_set]
+        if open_cells:
+            weights = [2 if abs(r - hr) + abs(c - hc) >= 3 else 1 for r, c in open_cells]
+            return self._rng.choices(open_cells, weights)[0]
 
         # Last resort: try forbidden corners (better than head which causes instant recapture)
-        forbidden_available = [pos for pos in DOT_FORBIDDEN if pos not in snake_set]
+        forbidden_available = [pos for pos in DOT_FORBIDDEN if (pos[0] << 3) | pos[1] not in snake_set]
         if forbidden_available:
-            return random.choice(forbidden_available)
+            return self._rng.choice(forbidden_available)
 
-        # Absolute last resort: random grid position not in snake (should be unreachable)
-        all_positions = [(r, c) for r in range(8) for c in range(8) if (r, c) not in snake_set]
-        if all_positions:
-            return random.choice(all_positions)
+        return (hr, hc)  # Grid completely full (theoretically impossible with 5-segment snake)
 
-        return head  # Grid completely full (theoretically impossible with 5-segment snake)
+    def _choose_snake_direction(self, head: tuple[int, int], dot: tuple[int, int], current_dir: tuple[int, int], snake_cells: Container[int]) -> tuple[int, int]:
+        """Choose snake direction toward dot (square geometry, no wrapping).
 
-    def _choose_snake_direction(self, head: tuple[int, int], dot: tuple[int, int], current_dir: tuple[int, int], snake_body: list[tuple[int, int]]) -> tuple[int, int]:
-        """Choose snake direction toward dot (square geometry, no wrapping)."""
-        hr, hc = head
-        dr, dc = dot
+        Scores each open direction by how much of the row/column gap to the dot
+        it closes, in one pass over SNAKE_DIRS. Ties between the two best
+        directions are broken at random.
 
-        # Calculate direct distances on square (no wrapping)
-        row_diff = dr - hr
-        col_diff = dc - hc
+        Args:
+            head: Snake head (row, col).
+            dot: Dot (row, col).
+            current_dir: Direction to keep if every neighbour is blocked.
+            snake_cells: Cells occupied by the snake as flat grid indices (row << 3 | col).
+        """
+        hr, hc = head
+        # Direct distances on square (no wrapping)
+        row_diff = dot[0] - hr
+        col_diff = dot[1] - hc
 
-        # Build list of valid directions (not blocked by wall or body)
-        valid_dirs = []
+        best_score = -1
+        best = runner_up = None
         for d in SNAKE_DIRS:
-            new_r = hr + d[0]
-            new_c = hc + d[1]
-            # Check bounds (snake stays on square)
-            if 0 <= new_r <= 7 and 0 <= new_c <= 7:
-                # Check not hitting own body
-                if (new_r, new_c) not in snake_body[1:]:
-                    valid_dirs.append(d)
-
-        if not valid_dirs:
-            return current_dir  # Stuck
-
-        # Score each valid direction by how much it reduces distance to dot
-        def score_dir(d: tuple[int, int]) -> int:
-            # Higher score = better (reduces distance more)
+            dr, dc = d
+            new_r = hr + dr
+            new_c = hc + dc
+            # Skip walls (snake stays on square) and own body
+            if not (0 <= new_r <= 7 and 0 <= new_c <= 7) or (new_r << 3) | new_c in snake_cells:
+                continue
+            # Higher score = moves further toward the dot
             score = 0
-            if row_diff > 0 and d[0] > 0:
-                score += abs(row_diff)  # Moving down toward dot below
-            elif row_diff < 0 and d[0] < 0:
-                score += abs(row_diff)  # Moving up toward dot above
-            if col_diff > 0 and d[1] > 0:
-                score += abs(col_diff)  # Moving right toward dot right
-            elif col_diff < 0 and d[1] < 0:
-                score += abs(col_diff)  # Moving left toward dot left
-            return score
-
-        # Sort by score descending
-        scored = [(score_dir(d), d) for d in valid_dirs]
-        scored.sort(key=lambda x: -x[0])
+            if (row_diff > 0 and dr > 0) or (row_diff < 0 and dr < 0):
+                score += abs(row_diff)
+            if (col_diff > 0 and dc > 0) or (col_diff < 0 and dc < 0):
+                score += abs(col_diff)
+            if score > best_score:
+                best_score, best, runner_up = score, d, None
+            elif score == best_score and runner_up is None:
+                runner_up = d
+
+        if best is None:
+            return current_dir  # Stuck
 
         # Pick best direction, with slight randomness
-        if len(scored) > 1 and scored[0][0] == scored[1][0] and random.random() > 0.5:
-            return scored[1][1]
-        return scored[0][1]
+        if runner_up is not None and self._rng.random() > 0.5:
+            return runner_up
+        return best
 
     def _move_dot_away(self, dot: tuple[int, int], snake_head: tuple[int, int]) -> tuple[int, int]:
-        """Move dot away from snake head (bounded square, no wrapping)."""
+        """Move dot away from snake head (bounded square, no wrapping).
+
+        Picks at random among the open neighbouring cells with the greatest
+        Manhattan distance from the snake head.
+        """
         dr, dc = dot
         hr, hc = snake_head
 
-        def square_distance(r1: int, c1: int, r2: int, c2: int) -> int:
-            """Calculate Manhattan distance on square (no wrapping)."""
-            return abs(r1 - r2) + abs(c1 - c2)
-
-        current_dist = square_distance(dr, dc, hr, hc)
-
-        # Score each direction, clamping to grid bounds (no wrapping)
-        scored_dirs = []
-        for d in DOT_DIRS:
-            new_r = max(0, min(7, dr + d[0]))
-            new_c = max(0, min(7, dc + d[1]))
-            # Skip if didn't actually move (hit wall)
-            if (new_r, new_c) == (dr, dc):
-                continue
-            # Skip forbidden positions
-            if (new_r, new_c) in DOT_FORBIDDEN:
-                continue
-            new_dist = square_distance(new_r, new_c, hr, hc)
-            # Prefer directions that increase distance from snake
-            scored_dirs.append((new_dist - current_dist, d))
+        best_dist = -1
+        best: list[tuple[int, int]] = []
+        for pos in DOT_MOVES[(dr << 3) | dc]:
+            dist = abs(pos[0] - hr) + abs(pos[1] - hc)
+            if dist > best_dist:
+                best_dist = dist
+                best = [pos]
+            elif dist == best_dist:
+                best.append(pos)
 
         # If all directions blocked, stay in place
-        if not scored_dirs:
+        if not best:
             return dot
-
-        # Sort by distance increase (descending)
-        scored_dirs.sort(key=lambda x: -x[0])
-
-        # Pick from best directions with some randomness
-        best_score = scored_dirs[0][0]
-        best_dirs = [d for score, d in scored_dirs if score == best_score]
-        direction = random.choice(best_dirs)
-
-        new_r = max(0, min(7, dr + direction[0]))
-        new_c = max(0, min(7, dc + direction[1]))
-        return (new_r, new_c)
+        return self._rng.choice(best)
 
     def _run_hunt_loop(self) -> None:
         """Run the hunt pattern continuously (default mode)."""
+        raise_thread_priority()
         self._enter_programmer_mode()
         self._clear_all_leds()
 
-        while self._running:
+        while not self._stop_event.is_set():
             # Run hunt pattern in long segments
             self._pattern_hunt(60.0)  # 1 minute per cycle
             self._clear_all_leds()
@@ -710,6 +998,7 @@ class LaunchpadLights:
 
     def _run_random_patterns(self) -> None:
         """Run random patterns, cycling every few seconds."""
+        raise_thread_priority()
         self._enter_programmer_mode()
         self._clear_all_leds()
 
@@ -724,8 +1013,8 @@ class LaunchpadLights:
             self._pattern_hunt,
         ]
 
-        while self._running:
-            pattern = random.choice(patterns)
+        while not self._stop_event.is_set():
+            pattern = self._rng.choice(patterns)
             pattern(PATTERN_DURATION)
             self._clear_all_leds()
 
@@ -751,10 +1040,10 @@ class LaunchpadLights:
             if not self.connect():
                 return False
 
-        if self._running:
+        if self.running:
             return True
 
-        self._running = True
+        self._stop_event.clear()
         if pattern == "random":
             self._thread = threading.Thread(target=self._run_random_patterns, daemon=True)
         else:
@@ -765,13 +1054,13 @@ class LaunchpadLights:
 
     def stop(self) -> None:
         """Stop the light pattern animation."""
-        if not self._running:
+        if not self.running:
             return
 
-        self._running = False
+        self._stop_event.set()
         if self._thread:
-            # Timeout longer than max pattern duration (60s hunt cycle)
-            self._thread.join(timeout=65.0)
+            # Patterns wake from their frame wait as soon as the event is set
+            self._thread.join(timeout=5.0)
             self._thread = None
         self._log("launchpad_lights", status="stopped")
 
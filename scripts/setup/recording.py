@@ -9,6 +9,7 @@ for a cat DJ recording session, and logs all actions.
 Usage:
     uv run python -m scripts.setup.recording
     uv run python -m scripts.setup.recording --cat-tv-url "https://youtube.com/..."
+    CLUBMAQUIS_LOG_FORMAT=msgpack uv run python -m scripts.setup.recording  # needs the msgpack extra
 """
 
 from __future__ import annotations
@@ -17,13 +18,10 @@ import argparse
 import os
 import subprocess
 import sys
-import time
 from datetime import UTC, datetime
+from functools import cache
 from pathlib import Path
 
-from scripts.common.logger import JSONLLogger
-from scripts.setup.launchers import check_launchpad, launch_chrome_to_url, launch_quicktime
-
 # Base directory for all Club Maquis session data (Google Drive)
 # Use CLUBMAQUIS_DATA_DIR env var if set, otherwise discover GDrive path
 
@@ -37,24 +35,26 @@ def _discover_default_data_dir() -> Path:
     2. A local 'ClubMaquis' directory under the user's home directory.
     """
     cloud_storage_root = Path.home() / "Library" / "CloudStorage"
-    if cloud_storage_root.is_dir():
-        for entry in sorted(cloud_storage_root.iterdir()):
-            if entry.is_dir() and entry.name.startswith("GoogleDrive-"):
-                return entry / "My Drive" / "My_Drive" / "ClubMaquis"
+    try:
+        # Cheap name check first; DirEntry.is_dir() then uses the listing's file type
+        with os.scandir(cloud_storage_root) as it:
+            drives = [entry.name for entry in it if entry.name.startswith("GoogleDrive-") and entry.is_dir()]
+    except (FileNotFoundError, NotADirectoryError):
+        drives = []
+    if drives:
+        return cloud_storage_root / min(drives) / "My Drive" / "My_Drive" / "ClubMaquis"
 
     # Fallback to a neutral, local directory if no Google Drive directory is found
     return Path.home() / "ClubMaquis"
 
 
-_DEFAULT_DATA_DIR = _discover_default_data_dir()
-BASE_DATA_DIR = Path(os.environ.get("CLUBMAQUIS_DATA_DIR", str(_DEFAULT_DATA_DIR)))
+# Only scan for the Google Drive directory when no override is set
+_DATA_DIR_OVERRIDE = os.environ.get("CLUBMAQUIS_DATA_DIR")
+BASE_DATA_DIR = Path(_DATA_DIR_OVERRIDE) if _DATA_DIR_OVERRIDE is not None else _discover_default_data_dir()
 
 # Default cat TV video URL
 DEFAULT_CAT_TV_URL = "https://www.youtube.com/watch?v=2WHuRziGaFg"
 
-# Delay between app launches to allow each app to initialize
-QUICKTIME_STARTUP_DELAY_SEC = 1
-
 # Banner width for consistent formatting
 BANNER_WIDTH = 58
 
@@ -68,6 +68,19 @@ def get_session_timestamp() -> str:
     return datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
 
 
+@cache
+def _ensure_base_dir(base_dir: Path) -> None:
+    """Create the data directory tree once per process.
+
+    Each parent component costs a stat, which is a network round-trip on a
+    Google Drive mount, so only the first session pays for it.
+
+    Args:
+        base_dir: Root directory for session data.
+    """
+    base_dir.mkdir(parents=True, exist_ok=True)
+
+
 def create_session_directory(session_id: str) -> Path:
     """Create a new timestamped session directory.
 
@@ -77,21 +90,23 @@ def create_session_directory(session_id: str) -> Path:
     Returns:
         Path to the created session directory.
     """
+    _ensure_base_dir(BASE_DATA_DIR)
     session_dir = BASE_DATA_DIR / session_id
-    session_dir.mkdir(parents=True, exist_ok=True)
+    session_dir.mkdir(exist_ok=True)
     return session_dir
 
 
-def get_log_filename(session_id: str) -> str:
+def get_log_filename(session_id: str, log_format: str = "jsonl") -> str:
     """Get the log filename for a session.
 
     Args:
         session_id: Session timestamp in YYYYMMDDTHHMMSSZ format.
+        log_format: Log format ("jsonl" or "msgpack"), used as the file extension.
 
     Returns:
-        Log filename in YYYYMMDDTHHMMSSZ_log.jsonl format.
+        Log filename in YYYYMMDDTHHMMSSZ_log.<log_format> format.
     """
-    return f"{session_id}_log.jsonl"
+    return f"{session_id}_log.{log_format}"
 
 
 def display_reminders(session_dir: Path) -> None:
@@ -102,30 +117,35 @@ def display_reminders(session_dir: Path) -> None:
     """
     border_width = BANNER_WIDTH + 2  # Account for '+' characters on each side
     date_prefix = datetime.now(UTC).strftime("%Y%m%d")
-    print()
-    print("=" * border_width)
-    print("  MANUAL STEPS REQUIRED")
-    print("=" * border_width)
-    print()
-    print("  QuickTime Player:")
-    print("    1. File > New Movie Recording (webcam + audio)")
-    print("    2. Click Record")
-    print()
-    print("  iPhone:")
-    print("    3. Start camera recording")
-    print()
-    print("  Sync:")
-    print("    4. CLAP loudly for sync point")
-    print()
-    print("  Then let Nerys DJ!")
-    print()
-    print("-" * border_width)
-    print("  FILE NAMING (when saving):")
-    print(f"    {date_prefix}_webcam.mov")
-    print(f"    {date_prefix}_iphone.mov")
-    print()
-    print(f"  SAVE TO: {session_dir}")
-    print("=" * border_width)
+    lines = [
+        "",
+        "=" * border_width,
+        "  MANUAL STEPS REQUIRED",
+        "=" * border_width,
+        "",
+        "  QuickTime Player:",
+        "    1. File > New Movie Recording (webcam + audio)",
+        "    2. Click Record",
+        "",
+        "  iPhone:",
+        "    3. Start camera recording",
+        "",
+        "  Sync:",
+        "    4. CLAP loudly for sync point",
+        "",
+        "  Then let Nerys DJ!",
+        "",
+        "-" * border_width,
+        "  FILE NAMING (when saving):",
+        f"    {date_prefix}_webcam.mov",
+        f"    {date_prefix}_iphone.mov",
+        "",
+        f"  SAVE TO: {session_dir}",
+        "=" * border_width,
+    ]
+    # One write instead of a line-buffered flush per print when stdout is a pipe or file
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def main() -> int:
@@ -151,14 +171,30 @@ Examples:
     )
     args = parser.parse_args()
 
-    # Print banner
-    print()
-    print(f"+{'=' * BANNER_WIDTH}+")
-    print(f"|{'CLUB MAQUIS SETUP':^{BANNER_WIDTH}}|")
-    print(f"|{'DJ Nerys drops beats.':^{BANNER_WIDTH}}|")
-    print(f"|{'Shelter pets get treats.':^{BANNER_WIDTH}}|")
-    print(f"+{'=' * BANNER_WIDTH}+")
-    print()
+    # Imported after argument parsing so --help and usage errors return immediately
+    from concurrent.futures import ThreadPoolExecutor
+
+    from scripts.common import make_logger, resolve_log_format
+    from scripts.setup.launchers import check_launchpad, launch_chrome_to_url, launch_quicktime
+
+    try:
+        # Chosen with $CLUBMAQUIS_LOG_FORMAT; checked before anything is launched
+        log_format = resolve_log_format()
+    except ValueError as e:
+        parser.error(str(e))
+
+    # Print banner in a single write
+    banner = [
+        "",
+        f"+{'=' * BANNER_WIDTH}+",
+        f"|{'CLUB MAQUIS SETUP':^{BANNER_WIDTH}}|",
+        f"|{'DJ Nerys drops beats.':^{BANNER_WIDTH}}|",
+        f"|{'Shelter pets get treats.':^{BANNER_WIDTH}}|",
+        f"+{'=' * BANNER_WIDTH}+",
+        "",
+    ]
+    sys.stdout.write("\n".join(banner) + "\n")
+    sys.stdout.flush()
 
     # Create session directory with timestamped ID
     session_id = get_session_timestamp()
@@ -166,83 +202,90 @@ Examples:
     print(f"Session directory: {session_dir}")
 
     # Initialize logger with timestamped filename
-    log_filename = get_log_filename(session_id)
+    log_filename = get_log_filename(session_id, log_format)
     log_path = session_dir / log_filename
-    logger = JSONLLogger(log_path)
-    logger.log("session_created", session_id=session_id, session_dir=str(session_dir), log_file=str(log_path))
-    print(f"Log file: {log_path}")
-    print()
-
-    # Track failures for exit code
-    failures = 0
-    lights_pid = None
-
-    # Pre-flight check: Launchpad (warning only, not critical)
-    print("Checking Launchpad connection...")
-    launchpad_connected = check_launchpad(logger)
-    if launchpad_connected:
-        print("  [OK] Launchpad Mini MK3 connected")
-        # Start cat-enticing light pattern as background process
-        print("  Starting hunt pattern (runs until shutdown)...")
-        try:
-            # Spawn lights as independent background process
-            lights_process = subprocess.Popen(
-                [sys.executable, "-m", "scripts.setup.run_lights", "--pattern", "hunt"],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                start_new_session=True,  # Detach from parent process
-            )
-            lights_pid = lights_process.pid
-            # Save PID to session directory for shutdown script
-            pid_file = session_dir / "lights.pid"
-            pid_file.write_text(str(lights_pid))
-            logger.log("launchpad_lights", status="started", pattern="hunt", pid=lights_pid, pid_file=str(pid_file))
-            print(f"  [OK] Hunt pattern running (PID: {lights_pid})")
-        except (OSError, subprocess.SubprocessError) as e:
-            print(f"  [!!] Could not start light pattern: {e}")
-            logger.log("launchpad_lights", status="error", error=str(e))
-    else:
-        print("  [!!] Launchpad not detected - check USB connection")
-    print()
-
-    # Launch applications
-    print("Launching applications...")
-
-    print("  Starting QuickTime Player...")
-    if launch_quicktime(logger):
-        print("  [OK] QuickTime launched")
-    else:
-        print("  [!!] Failed to launch QuickTime")
-        failures += 1
-    time.sleep(QUICKTIME_STARTUP_DELAY_SEC)
-
-    print("  Opening cat TV in Chrome...")
-    if launch_chrome_to_url(args.cat_tv_url, logger):
-        print("  [OK] Chrome opened to cat TV")
-    else:
-        print("  [!!] Failed to open Chrome")
-        failures += 1
-
-    # Log setup complete
-    logger.log("setup_complete", failures=failures, session_dir=str(session_dir), lights_pid=lights_pid)
-
-    # Display manual steps
-    display_reminders(session_dir)
-
-    # Note about Launchpad lights
-    if lights_pid:
-        print()
-        print("  [*] Hunt pattern running continuously to attract Nerys!")
-        print("      Lights will stop when you run the shutdown script.")
+    with make_logger(log_path, log_format) as logger:
+        logger.log("session_created", session_id=session_id, session_dir=str(session_dir), log_file=str(log_path))
+        print(f"Log file: {log_path}")
         print()
 
-    print(f"Session: {session_dir}")
-    print(f"Log: {log_path}")
-    if failures > 0:
-        print(f"[!!] {failures} application(s) failed to launch")
-    print()
+        # Track failures for exit code
+        failures = 0
+        lights_pid = None
+
+        # Probe the Launchpad while the apps launch: each step only waits on
+        # macOS, so the total is the slowest step. Only the lights wait on the probe.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            launchpad_future = executor.submit(check_launchpad, logger)
+            quicktime_future = executor.submit(launch_quicktime, logger)
+            chrome_future = executor.submit(launch_chrome_to_url, args.cat_tv_url, logger)
+
+            # Pre-flight check: Launchpad (warning only, not critical)
+            print("Checking Launchpad connection...")
+            launchpad_connected = launchpad_future.result()
+            if launchpad_connected:
+                print("  [OK] Launchpad Mini MK3 connected")
+                # Start cat-enticing light pattern as background process
+                print("  Starting hunt pattern (runs until shutdown)...")
+                try:
+                    # Spawn lights as independent background process
+                    lights_process = subprocess.Popen(
+                        [sys.executable, "-m", "scripts.setup.run_lights", "--pattern", "hunt"],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        start_new_session=True,  # Detach from parent process
+                    )
+                    lights_pid = lights_process.pid
+                    # Save PID to session directory for shutdown script
+                    pid_file = session_dir / "lights.pid"
+                    pid_file.write_text(str(lights_pid))
+                    logger.log("launchpad_lights", status="started", pattern="hunt", pid=lights_pid, pid_file=str(pid_file))
+                    print(f"  [OK] Hunt pattern running (PID: {lights_pid})")
+                except (OSError, subprocess.SubprocessError) as e:
+                    print(f"  [!!] Could not start light pattern: {e}")
+                    logger.log("launchpad_lights", status="error", error=str(e))
+            else:
+                print("  [!!] Launchpad not detected - check USB connection")
+            print()
+
+            # Launch applications
+            print("Launching applications...")
+
+            print("  Starting QuickTime Player and opening cat TV in Chrome...")
+            quicktime_ok = quicktime_future.result()
+            chrome_ok = chrome_future.result()
+
+        if quicktime_ok:
+            print("  [OK] QuickTime launched")
+        else:
+            print("  [!!] Failed to launch QuickTime")
+            failures += 1
+        if chrome_ok:
+            print("  [OK] Chrome opened to cat TV")
+        else:
+            print("  [!!] Failed to open Chrome")
+            failures += 1
+
+        # Log setup complete
+        logger.log("setup_complete", failures=failures, session_dir=str(session_dir), lights_pid=lights_pid)
+
+        # Display manual steps
+        display_reminders(session_dir)
+
+        # Note about Launchpad lights
+        if lights_pid:
+            print()
+            print("  [*] Hunt pattern running continuously to attract Nerys!")
+            print("      Lights will stop when you run the shutdown script.")
+            print()
+
+        print(f"Session: {session_dir}")
+        print(f"Log: {log_path}")
+        if failures > 0:
+            print(f"[!!] {failures} application(s) failed to launch")
+        print()
 
-    return 1 if failures > 0 else 0
+        return 1 if failures > 0 else 0
 
 
 if __name__ == "__main__":
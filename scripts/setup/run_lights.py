@@ -16,8 +16,9 @@ import argparse
 import random
 import signal
 import sys
+import threading
 
-from scripts.setup.launchpad_lights import PATTERN_DURATION, LaunchpadLights
+from scripts.setup.launchpad_lights import PATTERN_DURATION, LaunchpadLights, raise_thread_priority
 
 
 def main() -> int:
@@ -32,15 +33,12 @@ def main() -> int:
     args = parser.parse_args()
 
     lights = LaunchpadLights()
+    stop_requested = threading.Event()
 
     def shutdown_handler(signum, frame):
-        """Handle shutdown signals gracefully."""
-        try:
-            lights.disconnect()
-        except Exception:
-            pass  # Ignore cleanup errors; process is exiting anyway
-        finally:
-            sys.exit(0)
+        """Request a graceful shutdown; cleanup runs in the main loop, not here."""
+        stop_requested.set()
+        lights.running = False  # Wakes the current pattern's frame wait
 
     # Register signal handlers for graceful shutdown
     signal.signal(signal.SIGTERM, shutdown_handler)
@@ -53,30 +51,30 @@ def main() -> int:
     print(f"Connected! {args.pattern.capitalize()} pattern running...")
 
     # Start the pattern (this blocks in the current thread)
-    lights.running = True
+    raise_thread_priority()
+    lights.running = not stop_requested.is_set()
     lights.enter_programmer_mode()
     lights.clear_all_leds()
 
     try:
         if args.pattern == "random":
-            while lights.running:
-                patterns = [
-                    lights.pattern_snake,
-                    lights.pattern_sparkle,
-                    lights.pattern_rain,
-                    lights.pattern_spiral,
-                    lights.pattern_wave,
-                    lights.pattern_diagonal,
-                    lights.pattern_expand,
-                    lights.pattern_hunt,
-                ]
-                pattern = random.choice(patterns)
-                pattern(PATTERN_DURATION)
+            patterns = (
+                lights.pattern_snake,
+                lights.pattern_sparkle,
+                lights.pattern_rain,
+                lights.pattern_spiral,
+                lights.pattern_wave,
+                lights.pattern_diagonal,
+                lights.pattern_expand,
+                lights.pattern_hunt,
+            )
+            while not stop_requested.is_set():
+                random.choice(patterns)(PATTERN_DURATION)
                 lights.clear_all_leds()
         else:
             # Hunt pattern runs continuously in 60-second cycles
             # (longer than random patterns to give cat time to engage with chase)
-            while lights.running:
+            while not stop_requested.is_set():
                 lights.pattern_hunt(60.0)
                 lights.clear_all_leds()
     except KeyboardInterrupt:
@@ -6,7 +6,7 @@ This module provides utilities to gracefully stop all recording sources,
 save files to the session directory, and upload to Google Photos.
 
 Usage:
-    uv run python scripts/shutdown/main.py <YYYYMMDDTHHMMSSZ>
+    uv run python -m scripts.shutdown.main <YYYYMMDDTHHMMSSZ>
 
 Modules:
     main: CLI entry point and orchestration
@@ -3,7 +3,7 @@
 """Shutdown script for Club Maquis recording sessions.
 
 Usage:
-    uv run python scripts/shutdown/main.py <YYYYMMDDTHHMMSSZ>
+    uv run python -m scripts.shutdown.main <YYYYMMDDTHHMMSSZ>
 
 This script:
 1. Prompts user to save QuickTime recordings to session directory
@@ -16,20 +16,12 @@ Note: User manually names files as YYYYMMDD_<filename>.<ext>
 
 from __future__ import annotations
 
-import argparse
 import os
-import re
-import signal
 import sys
-import time
+from functools import cache
+from operator import attrgetter
 from pathlib import Path
 
-# Add project root to path for imports
-PROJECT_ROOT = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
-
-from src.clubmaquis.session_logger import ActionStatus, ActionType, SessionLogger  # noqa: E402
-
 # Base directory for all Club Maquis sessions (Google Drive)
 # Use CLUBMAQUIS_DATA_DIR env var if set, otherwise discover GDrive path
 
@@ -43,20 +35,28 @@ def _discover_default_data_dir() -> Path:
     2. A local 'ClubMaquis' directory under the user's home directory.
     """
     cloud_storage_root = Path.home() / "Library" / "CloudStorage"
-    if cloud_storage_root.is_dir():
-        for entry in sorted(cloud_storage_root.iterdir()):
-            if entry.is_dir() and entry.name.startswith("GoogleDrive-"):
-                return entry / "My Drive" / "My_Drive" / "ClubMaquis"
+    try:
+        # Cheap name check first; DirEntry.is_dir() then uses the listing's file type
+        with os.scandir(cloud_storage_root) as it:
+            drives = [entry.name for entry in it if entry.name.startswith("GoogleDrive-") and entry.is_dir()]
+    except (FileNotFoundError, NotADirectoryError):
+        drives = []
+    if drives:
+        return cloud_storage_root / min(drives) / "My Drive" / "My_Drive" / "ClubMaquis"
 
     # Fallback to a neutral, local directory if no Google Drive directory is found
     return Path.home() / "ClubMaquis"
 
 
-_DEFAULT_DATA_DIR = _discover_default_data_dir()
-BASE_DATA_DIR = Path(os.environ.get("CLUBMAQUIS_DATA_DIR", str(_DEFAULT_DATA_DIR)))
+# Only scan for the Google Drive directory when no override is set
+_DATA_DIR_OVERRIDE = os.environ.get("CLUBMAQUIS_DATA_DIR")
+BASE_DATA_DIR = Path(_DATA_DIR_OVERRIDE) if _DATA_DIR_OVERRIDE is not None else _discover_default_data_dir()
+
+# File extensions reported as session media
+MEDIA_EXTENSIONS = frozenset({".mov", ".mp4", ".m4v", ".jpg", ".jpeg", ".png", ".heic"})
 
-# Pattern to match session ID format
-SESSION_ID_PATTERN = re.compile(r"^\d{8}T\d{6}Z$")
+# Seconds to wait for the lights process to exit (longer than the 60s hunt cycle)
+LIGHTS_EXIT_TIMEOUT_SEC = 65.0
 
 # Script version for logging
 SCRIPT_VERSION = "2.0.0"
@@ -64,10 +64,22 @@ SCRIPT_VERSION = "2.0.0"
 # Banner width for consistent formatting
 BANNER_WIDTH = 60
 
+# Banner lines, built once
+BANNER_RULE = "=" * BANNER_WIDTH
+BANNER_DIVIDER = "-" * BANNER_WIDTH
+BANNER_BORDER = f"+{BANNER_RULE}+"
+
 
 def validate_session_id(session_id: str) -> bool:
     """Validate session ID matches YYYYMMDDTHHMMSSZ format."""
-    return bool(SESSION_ID_PATTERN.match(session_id))
+    # isdecimal() accepts the same characters as the regex class \d
+    return len(session_id) == 16 and session_id[8] == "T" and session_id[15] == "Z" and session_id[:8].isdecimal() and session_id[9:15].isdecimal()
+
+
+@cache
+def _resolve_base_dir(base_dir: Path) -> Path:
+    """Resolve the data directory once per process (each resolve walks every path component)."""
+    return base_dir.resolve()
 
 
 def get_session_dir(session_id: str) -> Path:
@@ -82,8 +94,8 @@ def get_session_dir(session_id: str) -> Path:
     Raises:
         ValueError: If the constructed path escapes BASE_DATA_DIR (path injection).
     """
-    session_dir = (BASE_DATA_DIR / session_id).resolve()
-    base_resolved = BASE_DATA_DIR.resolve()
+    base_resolved = _resolve_base_dir(BASE_DATA_DIR)
+    session_dir = (base_resolved / session_id).resolve()
     # Validate path stays within BASE_DATA_DIR (prevents path injection)
     if not session_dir.is_relative_to(base_resolved):
         raise ValueError(f"Invalid session directory: {session_dir}")
@@ -93,6 +105,11 @@ def get_session_dir(session_id: str) -> Path:
 def get_log_filename(session_id: str) -> str:
     """Get the log filename for a session.
 
+    Always JSONL: shutdown logs through SessionLogger, which only writes
+    JSON lines. A setup log written with CLUBMAQUIS_LOG_FORMAT=msgpack is
+    kept in its own YYYYMMDDTHHMMSSZ_log.msgpack file, so the two formats
+    never share a file; both are reported by the directory scan.
+
     Args:
         session_id: Session timestamp in YYYYMMDDTHHMMSSZ format.
 
@@ -102,40 +119,38 @@ def get_log_filename(session_id: str) -> str:
     return f"{session_id}_log.jsonl"
 
 
-def find_session_files(session_dir: Path) -> list[Path]:
-    """Find all files in the session directory.
+def get_expected_filenames(session_id: str) -> tuple[str, str]:
+    """Get the names the user is asked to save the recordings under.
 
     Args:
-        session_dir: Path to session directory.
+        session_id: Session timestamp in YYYYMMDDTHHMMSSZ format.
 
     Returns:
-        List of absolute paths to files in the session directory.
+        Tuple of (webcam, iPhone) filenames in YYYYMMDD_<type>.mov format.
     """
-    if not session_dir.exists():
-        return []
-    return sorted([f.resolve() for f in session_dir.iterdir() if f.is_file()])
+    date_prefix = session_id[:8]  # YYYYMMDD from YYYYMMDDTHHMMSSZ
+    return f"{date_prefix}_webcam.mov", f"{date_prefix}_iphone.mov"
 
 
-def _wait_for_process_exit(pid: int, timeout: float = 65.0) -> bool:
-    """Wait for a process to exit.
+def find_session_files(session_dir: Path) -> list[Path]:
+    """Find all files in the session directory.
 
     Args:
-        pid: Process ID to wait for.
-        timeout: Maximum seconds to wait (default 65s, longer than 60s hunt cycle).
+        session_dir: Path to session directory.
 
     Returns:
-        True if process exited, False if timeout reached.
+        List of absolute paths to files in the session directory, ordered by file name.
     """
-    start = time.time()
-    while time.time() - start < timeout:
-        try:
-            os.kill(pid, 0)  # Check if process is still alive (doesn't actually kill)
-            time.sleep(0.5)
-        except ProcessLookupError:
-            return True  # Process exited
-        except PermissionError:
-            return True  # Can't check, assume exited
-    return False  # Timeout
+    # One scandir pass: DirEntry.is_file() uses the directory listing's file
+    # type, so regular files need no stat and no per-file path resolution.
+    # Entries are sorted by name as plain strings before any Path is built.
+    base = session_dir.resolve()
+    try:
+        with os.scandir(base) as it:
+            entries = sorted((entry for entry in it if entry.is_file()), key=attrgetter("name"))
+    except FileNotFoundError:
+        return []
+    return [Path(entry.path).resolve() if entry.is_symlink() else base / entry.name for entry in entries]
 
 
 def stop_launchpad_lights(session_dir: Path) -> tuple[bool, int | None]:
@@ -147,37 +162,44 @@ def stop_launchpad_lights(session_dir: Path) -> tuple[bool, int | None]:
     Returns:
         Tuple of (success, pid) - pid is None if no PID file found.
     """
+    import signal
     import subprocess
 
+    from scripts.shutdown.utils import PGREP_BIN, wait_for_process_exits
+
     pid_file = session_dir / "lights.pid"
     stopped_pid = None
     pids_to_wait: list[int] = []
 
-    # Try PID file first
-    if pid_file.exists():
+    # Also search for the process by command pattern (handles Google Drive sync
+    # delay); pgrep runs while the PID file is handled below
+    try:
+        pgrep = subprocess.Popen([PGREP_BIN, "-f", "scripts.setup.run_lights"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, close_fds=False)
+    except OSError:
+        pgrep = None  # pgrep unavailable, continue with the PID file alone
+
+    try:
+        # Try PID file first; reading it directly doubles as the existence check
         try:
-            pid = int(pid_file.read_text().strip())
+            pid = int(pid_file.read_bytes())  # int() ignores surrounding whitespace
             os.kill(pid, signal.SIGTERM)
             stopped_pid = pid
             pids_to_wait.append(pid)
-        except (ValueError, ProcessLookupError):
-            pass  # PID invalid or process already gone
+        except (FileNotFoundError, ValueError, ProcessLookupError):
+            pass  # No PID file, PID invalid, or process already gone
         except PermissionError:
             return False, None
         finally:
             pid_file.unlink(missing_ok=True)
 
-    # Also search for process by command pattern (handles Google Drive sync delay)
-    try:
-        result = subprocess.run(
-            ["pgrep", "-f", "scripts.setup.run_lights"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            for line in result.stdout.strip().split("\n"):
-                if line:
+        if pgrep is not None:
+            try:
+                stdout, _ = pgrep.communicate(timeout=5)
+            except subprocess.TimeoutExpired:
+                stdout = b""  # pgrep hung, continue with whatever we have
+            if pgrep.returncode == 0:
+                # One PID per line; int() parses the ASCII bytes directly
+                for line in stdout.split():
                     try:
                         pid = int(line)
                         os.kill(pid, signal.SIGTERM)
@@ -187,47 +209,61 @@ def stop_launchpad_lights(session_dir: Path) -> tuple[bool, int | None]:
                             pids_to_wait.append(pid)
                     except (ValueError, ProcessLookupError, PermissionError):
                         pass  # Ignore individual kill failures; continue stopping others
-    except (subprocess.SubprocessError, OSError):
-        pass  # pgrep failed, continue with whatever we have
+    finally:
+        if pgrep is not None and pgrep.poll() is None:
+            pgrep.kill()
+            pgrep.wait()
 
     # Wait for all signaled processes to actually terminate
-    for pid in pids_to_wait:
-        _wait_for_process_exit(pid)
+    wait_for_process_exits(pids_to_wait, LIGHTS_EXIT_TIMEOUT_SEC)
 
     return True, stopped_pid
 
 
-def display_save_prompts(session_dir: Path, session_id: str) -> None:
+def _emit(lines: list[str]) -> None:
+    """Write lines to stdout in one call (print() flushes per line on a TTY).
+
+    Args:
+        lines: Output lines, without trailing newlines.
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def display_save_prompts(session_dir: Path, expected_files: tuple[str, str]) -> None:
     """Display prompts for user to save files.
 
     Args:
         session_dir: Path to session directory.
-        session_id: Session timestamp for file naming guidance.
+        expected_files: (webcam, iPhone) filenames from get_expected_filenames().
     """
-    date_prefix = session_id[:8]  # YYYYMMDD from YYYYMMDDTHHMMSSZ
-
-    print()
-    print("=" * BANNER_WIDTH)
-    print("  SAVE FILES TO SESSION DIRECTORY")
-    print("=" * BANNER_WIDTH)
-    print()
-    print(f"  Session: {session_dir}")
-    print()
-    print("-" * BANNER_WIDTH)
-    print("  1. QUICKTIME RECORDINGS")
-    print("-" * BANNER_WIDTH)
-    print("     In QuickTime: File > Save")
-    print(f"     Save to: {session_dir}")
-    print(f"     Name as: {date_prefix}_webcam.mov")
-    print()
-    print("-" * BANNER_WIDTH)
-    print("  2. IPHONE VIDEO")
-    print("-" * BANNER_WIDTH)
-    print("     AirDrop video to this Mac")
-    print(f"     Move to: {session_dir}")
-    print(f"     Name as: {date_prefix}_iphone.mov")
-    print()
-    print("=" * BANNER_WIDTH)
+    webcam_name, iphone_name = expected_files
+
+    lines = [
+        "",
+        BANNER_RULE,
+        "  SAVE FILES TO SESSION DIRECTORY",
+        BANNER_RULE,
+        "",
+        f"  Session: {session_dir}",
+        "",
+        BANNER_DIVIDER,
+        "  1. QUICKTIME RECORDINGS",
+        BANNER_DIVIDER,
+        "     In QuickTime: File > Save",
+        f"     Save to: {session_dir}",
+        f"     Name as: {webcam_name}",
+        "",
+        BANNER_DIVIDER,
+        "  2. IPHONE VIDEO",
+        BANNER_DIVIDER,
+        "     AirDrop video to this Mac",
+        f"     Move to: {session_dir}",
+        f"     Name as: {iphone_name}",
+        "",
+        BANNER_RULE,
+    ]
+    _emit(lines)
 
 
 def run_shutdown(session_id: str) -> int:
@@ -239,6 +275,10 @@ def run_shutdown(session_id: str) -> int:
     Returns:
         Exit code (0 for success, 1 for errors).
     """
+    from scripts.common import LOG_EXTENSIONS
+    from src.clubmaquis.session_logger import ActionStatus, ActionType, SessionLogger
+
+    # Already resolved, so it is used as the absolute path in every log entry below
     session_dir = get_session_dir(session_id)
 
     # Validate session directory exists (should be created by setup script)
@@ -249,139 +289,147 @@ def run_shutdown(session_id: str) -> int:
 
     # Initialize logger with timestamped filename
     log_filename = get_log_filename(session_id)
-    logger = SessionLogger(session_dir, log_filename)
-
-    # Log session shutdown start with full context
-    logger.log_start(
-        ActionType.SESSION_END,
-        "Starting shutdown sequence",
-        details={
-            "session_id": session_id,
-            "session_dir": str(session_dir.resolve()),
-            "base_data_dir": str(BASE_DATA_DIR.resolve()),
-            "log_file": str((session_dir / log_filename).resolve()),
-            "script_version": SCRIPT_VERSION,
-        },
-    )
-
-    # Print banner
-    print()
-    print(f"+{'=' * BANNER_WIDTH}+")
-    print(f"|{'CLUB MAQUIS SHUTDOWN':^{BANNER_WIDTH}}|")
-    print(f"+{'=' * BANNER_WIDTH}+")
-
-    # Stop Launchpad lights first
-    print()
-    print("Stopping Launchpad lights (may take up to 60s if mid-pattern)...")
-    lights_stopped, lights_pid = stop_launchpad_lights(session_dir)
-    if lights_pid:
-        print(f"  [OK] Lights stopped (PID: {lights_pid})")
-        logger.log(
-            ActionType.LAUNCHPAD_LIGHTS,
-            ActionStatus.SUCCESS,
-            "Stopped Launchpad lights",
-            details={"pid": lights_pid},
-        )
-    elif lights_stopped:
-        print("  [--] No lights process found (already stopped or not started)")
-    else:
-        print("  [!!] Failed to stop lights process")
-        logger.log(
-            ActionType.LAUNCHPAD_LIGHTS,
-            ActionStatus.FAILED,
-            "Failed to stop Launchpad lights",
+    with SessionLogger(session_dir, log_filename) as logger:
+        # Log session shutdown start with full context
+        logger.log_start(
+            ActionType.SESSION_END,
+            "Starting shutdown sequence",
+            details={
+                "session_id": session_id,
+                "session_dir": str(session_dir),
+                "base_data_dir": str(_resolve_base_dir(BASE_DATA_DIR)),
+                "log_file": str(logger.log_file),
+                "script_version": SCRIPT_VERSION,
+            },
         )
 
-    # Display save prompts
-    display_save_prompts(session_dir, session_id)
-
-    # Log that user was prompted
-    logger.log(
-        ActionType.USER_PROMPT,
-        ActionStatus.SUCCESS,
-        "Displayed file save instructions to user",
-        details={
-            "session_dir": str(session_dir.resolve()),
-            "expected_files": [
-                f"{session_id[:8]}_webcam.mov",
-                f"{session_id[:8]}_iphone.mov",
-            ],
-        },
-    )
-
-    # Wait for user confirmation
-    print()
-    try:
-        input("  Press ENTER when files are saved to continue...")
-    except KeyboardInterrupt:
-        print("\n\nShutdown cancelled by user.")
-        logger.log(
-            ActionType.USER_CONFIRM,
-            ActionStatus.FAILED,
-            "User cancelled shutdown",
-            details={"reason": "KeyboardInterrupt"},
+        # Print banner, then stop Launchpad lights first
+        _emit(
+            [
+                "",
+                BANNER_BORDER,
+                f"|{'CLUB MAQUIS SHUTDOWN':^{BANNER_WIDTH}}|",
+                BANNER_BORDER,
+                "",
+                "Stopping Launchpad lights (may take up to 60s if mid-pattern)...",
+            ]
+        )
+        # Entries up to the prompt are written together, before input() waits
+        with logger.batch():
+            lights_stopped, lights_pid = stop_launchpad_lights(session_dir)
+            if lights_pid:
+                print(f"  [OK] Lights stopped (PID: {lights_pid})")
+                logger.log(
+                    ActionType.LAUNCHPAD_LIGHTS,
+                    ActionStatus.SUCCESS,
+                    "Stopped Launchpad lights",
+                    details={"pid": lights_pid},
+                )
+            elif lights_stopped:
+                print("  [--] No lights process found (already stopped or not started)")
+            else:
+                print("  [!!] Failed to stop lights process")
+                logger.log(
+                    ActionType.LAUNCHPAD_LIGHTS,
+                    ActionStatus.FAILED,
+                    "Failed to stop Launchpad lights",
+                )
+
+            # Display save prompts
+            expected_files = get_expected_filenames(session_id)
+            display_save_prompts(session_dir, expected_files)
+
+            # Log that user was prompted
+            logger.log(
+                ActionType.USER_PROMPT,
+                ActionStatus.SUCCESS,
+                "Displayed file save instructions to user",
+                details={
+                    "session_dir": str(session_dir),
+                    "expected_files": list(expected_files),
+                },
+            )
+
+        # Wait for user confirmation
+        print()
+        try:
+            input("  Press ENTER when files are saved to continue...")
+        except KeyboardInterrupt:
+            print("\n\nShutdown cancelled by user.")
+            logger.log(
+                ActionType.USER_CONFIRM,
+                ActionStatus.FAILED,
+                "User cancelled shutdown",
+                details={"reason": "KeyboardInterrupt"},
+            )
+            return 1
+
+        # Confirmation and results are written together once the scan is done
+        with logger.batch():
+            logger.log(
+                ActionType.USER_CONFIRM,
+                ActionStatus.SUCCESS,
+                "User confirmed files are saved",
+            )
+
+            # Scan session directory for files
+            _emit(["", BANNER_DIVIDER, "  SCANNING SESSION DIRECTORY", BANNER_DIVIDER])
+
+            session_files = find_session_files(session_dir)
+            media_files: list[Path] = []
+            log_files: list[Path] = []
+            for f in session_files:
+                suffix = f.suffix.lower()
+                if suffix in MEDIA_EXTENSIONS:
+                    media_files.append(f)
+                elif suffix in LOG_EXTENSIONS:
+                    log_files.append(f)
+
+            lines = ["", f"  Found {len(media_files)} media file(s):"]
+            for f in media_files:
+                size_mb = f.stat().st_size / (1024 * 1024)
+                lines.append(f"    - {f.name} ({size_mb:.1f} MB)")
+            lines += ["", f"  Found {len(log_files)} log file(s):"]
+            lines.extend(f"    - {f.name}" for f in log_files)
+            _emit(lines)
+
+            # Log session end with absolute paths
+            logger.log(
+                ActionType.SESSION_END,
+                ActionStatus.SUCCESS,
+                "Shutdown sequence complete",
+                details={
+                    "session_id": session_id,
+                    "session_dir": str(session_dir),
+                    "media_files": [str(f) for f in media_files],
+                    "log_files": [str(f) for f in log_files],
+                    "total_files": len(session_files),
+                },
+            )
+
+        _emit(
+            [
+                "",
+                BANNER_RULE,
+                "  SHUTDOWN COMPLETE",
+                BANNER_RULE,
+                "",
+                f"  Session: {session_dir}",
+                f"  Log: {logger.log_file}",
+                "",
+            ]
         )
-        return 1
-
-    logger.log(
-        ActionType.USER_CONFIRM,
-        ActionStatus.SUCCESS,
-        "User confirmed files are saved",
-    )
-
-    # Scan session directory for files
-    print()
-    print("-" * BANNER_WIDTH)
-    print("  SCANNING SESSION DIRECTORY")
-    print("-" * BANNER_WIDTH)
-
-    session_files = find_session_files(session_dir)
-    media_extensions = {".mov", ".mp4", ".m4v", ".jpg", ".jpeg", ".png", ".heic"}
-    media_files = [f for f in session_files if f.suffix.lower() in media_extensions]
-    log_files = [f for f in session_files if f.suffix.lower() == ".jsonl"]
-
-    print()
-    print(f"  Found {len(media_files)} media file(s):")
-    for f in media_files:
-        size_mb = f.stat().st_size / (1024 * 1024)
-        print(f"    - {f.name} ({size_mb:.1f} MB)")
-
-    print()
-    print(f"  Found {len(log_files)} log file(s):")
-    for f in log_files:
-        print(f"    - {f.name}")
-
-    # Log session end with absolute paths
-    logger.log(
-        ActionType.SESSION_END,
-        ActionStatus.SUCCESS,
-        "Shutdown sequence complete",
-        details={
-            "session_id": session_id,
-            "session_dir": str(session_dir.resolve()),
-            "media_files": [str(f) for f in media_files],
-            "log_files": [str(f) for f in log_files],
-            "total_files": len(session_files),
-        },
-    )
-
-    print()
-    print("=" * BANNER_WIDTH)
-    print("  SHUTDOWN COMPLETE")
-    print("=" * BANNER_WIDTH)
-    print()
-    print(f"  Session: {session_dir}")
-    print(f"  Log: {session_dir / log_filename}")
-    print()
 
-    return 0
+        return 0
 
 
 def main() -> int:
     """Main entry point for the shutdown script."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Shutdown Club Maquis recording session",
-        epilog="Example: uv run python scripts/shutdown/main.py 20251231T120000Z",
+        epilog="Example: uv run python -m scripts.shutdown.main 20251231T120000Z",
     )
     parser.add_argument(
         "session_id",
@@ -12,6 +12,34 @@ from scripts.shutdown.utils import OperationResult, is_app_running, quit_app, ru
 # QuickTime Player process name
 PROCESS_NAME = "QuickTime Player"
 
+# Returned by STOP_RECORDINGS_SCRIPT when QuickTime Player is not running
+NOT_RUNNING = "not running"
+
+# Checks that QuickTime Player is running and stops every document in one
+# osascript launch; "is running" does not start the application.
+STOP_RECORDINGS_SCRIPT = f"""
+if application "{PROCESS_NAME}" is not running then
+    return "{NOT_RUNNING}"
+end if
+
+tell application "{PROCESS_NAME}"
+    set docCount to count of documents
+    if docCount = 0 then
+        return "0"
+    end if
+
+    set stoppedCount to 0
+    repeat with doc in documents
+        try
+            stop doc
+            set stoppedCount to stoppedCount + 1
+        end try
+    end repeat
+
+    return stoppedCount as string
+end tell
+"""
+
 
 def is_running() -> bool:
     """Check if QuickTime Player is running."""
@@ -27,34 +55,7 @@ def stop_all_recordings() -> OperationResult:
     Returns:
         OperationResult with success status and count of documents stopped.
     """
-    if not is_running():
-        return OperationResult(
-            success=False,
-            message="QuickTime Player is not running",
-            details={"documents_stopped": 0},
-        )
-
-    # AppleScript to stop all recordings
-    script = """
-    tell application "QuickTime Player"
-        set docCount to count of documents
-        if docCount = 0 then
-            return "0"
-        end if
-
-        set stoppedCount to 0
-        repeat with doc in documents
-            try
-                stop doc
-                set stoppedCount to stoppedCount + 1
-            end try
-        end repeat
-
-        return stoppedCount as string
-    end tell
-    """
-
-    success, stdout, stderr = run_applescript(script)
+    success, stdout, stderr = run_applescript(STOP_RECORDINGS_SCRIPT)
 
     if not success:
         return OperationResult(
@@ -63,6 +64,13 @@ def stop_all_recordings() -> OperationResult:
             details={"documents_stopped": 0, "stderr": stderr},
         )
 
+    if stdout == NOT_RUNNING:
+        return OperationResult(
+            success=False,
+            message="QuickTime Player is not running",
+            details={"documents_stopped": 0},
+        )
+
     try:
         stopped_count = int(stdout)
     except ValueError:
@@ -7,14 +7,46 @@ Provides common AppleScript operations and result types.
 
 from __future__ import annotations
 
+import os
+import re
+import select
 import subprocess
+import sys
+import threading
 import time
+from collections.abc import Collection
+from contextlib import closing
 from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from functools import cache
 from pathlib import Path
 from typing import Any
 
+# Backoff bounds when polling for a process to exit
+PROCESS_EXIT_POLL_MIN_SEC = 0.05
+PROCESS_EXIT_POLL_MAX_SEC = 0.5
 
-@dataclass
+# Seconds an is_app_running() answer is reused for the same process name
+APP_RUNNING_CACHE_TTL_SEC = 0.2
+
+# Process name -> (time.monotonic() when checked, running)
+_running_cache: dict[str, tuple[float, bool]] = {}
+
+# Returned by the quit script when the app was not running
+APP_NOT_RUNNING = "not_running"
+
+# Characters with special meaning in the extended regex pgrep takes as its pattern
+_ERE_SPECIAL = re.compile(r"[.\[\]()*+?{}|^$\\]")
+
+# Longest process name `pgrep -x` can match (MAXCOMLEN on macOS, TASK_COMM_LEN - 1 on Linux)
+PGREP_NAME_MAX = 16 if sys.platform == "darwin" else 15
+
+# Absolute tool paths; subprocess only uses posix_spawn for a path-qualified executable
+OSASCRIPT_BIN = "/usr/bin/osascript"
+PGREP_BIN = "/usr/bin/pgrep"
+
+
+@dataclass(slots=True)
 class OperationResult:
     """Generic result for shutdown operations."""
 
@@ -40,23 +72,196 @@ def is_app_running(process_name: str) -> bool:
         process_name: Name of the process to check (e.g., "QuickTime Player", "Live").
 
     Returns:
-        True if the application is running, False otherwise.
+        True if the application is running, False otherwise. Answers are
+        reused for APP_RUNNING_CACHE_TTL_SEC (see invalidate_app_cache()).
+    """
+    now = time.monotonic()
+    cached = _running_cache.get(process_name)
+    if cached is not None and now - cached[0] < APP_RUNNING_CACHE_TTL_SEC:
+        return cached[1]
+
+    # A pgrep hit answers without loading AppleScript. pgrep matches the
+    # executable name, which can differ from the System Events display name,
+    # so a miss is confirmed through System Events.
+    if _pids_of(process_name):
+        running = True
+    else:
+        _, stdout, _ = run_applescript(_running_script(process_name))
+        running = stdout.lower() == "true"
+    _running_cache[process_name] = (now, running)
+    return running
+
+
+def _applescript_string(value: str) -> str:
+    """Quote a value as an AppleScript string literal.
+
+    Args:
+        value: Text to embed, e.g. an app or process name.
+
+    Returns:
+        The value in double quotes with backslashes and quotes escaped.
+    """
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+@cache
+def _running_script(process_name: str) -> str:
+    """Build (once per name) the AppleScript asking System Events whether a process is running."""
+    # "as text" gives the same "true"/"false" in-process and from osascript
+    return f"""
+    tell application "System Events"
+        return ((name of processes) contains {_applescript_string(process_name)}) as text
+    end tell
     """
-    script = f'''
+
+
+@cache
+def _quit_script(app_name: str, process_name: str) -> str:
+    """Build (once per app) the AppleScript that quits an app if its process is running."""
+    # The running check and the quit share one osascript launch
+    return f'''
     tell application "System Events"
-        return (name of processes) contains "{process_name}"
+        if (name of processes) does not contain {_applescript_string(process_name)} then return "{APP_NOT_RUNNING}"
+    end tell
+    tell application {_applescript_string(app_name)}
+        quit
     end tell
     '''
+
+
+def invalidate_app_cache(process_name: str) -> None:
+    """Forget the cached is_app_running() answer for a process.
+
+    Args:
+        process_name: Name of the process whose state is about to change.
+    """
+    _running_cache.pop(process_name, None)
+
+
+def wait_for_process_exits(pids: Collection[int], timeout: float) -> bool:
+    """Wait for processes to exit, all within one shared timeout.
+
+    Blocks on exit notifications (kqueue on macOS, pidfds on Linux) for every
+    process at once, so the wait ends as soon as the last one is gone; polls
+    where neither works.
+
+    Args:
+        pids: Process IDs to wait for.
+        timeout: Maximum seconds to wait.
+
+    Returns:
+        True if every process exited, False if timeout reached.
+    """
+    deadline = time.monotonic() + timeout
     try:
-        result = subprocess.run(
-            ["osascript", "-e", script],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        return result.stdout.strip().lower() == "true"
-    except subprocess.SubprocessError:
-        return False
+        if hasattr(select, "kqueue"):
+            with closing(select.kqueue()) as kq:
+                waiting: set[int] = set()
+                for pid in pids:
+                    try:
+                        kq.control([select.kevent(pid, select.KQ_FILTER_PROC, select.KQ_EV_ADD | select.KQ_EV_ONESHOT, select.KQ_NOTE_EXIT)], 0)
+                        waiting.add(pid)
+                    except ProcessLookupError:
+                        pass  # Already exited
+                while waiting:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    for event in kq.control(None, len(waiting), remaining):
+                        waiting.discard(event.ident)
+                return True
+        if hasattr(os, "pidfd_open"):
+            pidfds: dict[int, int] = {}
+            try:
+                for pid in pids:
+                    try:
+                        pidfds[os.pidfd_open(pid)] = pid
+                    except ProcessLookupError:
+                        pass  # Already exited
+                while pidfds:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    # A pidfd becomes readable once its process exits
+                    readable, _, _ = select.select(list(pidfds), [], [], remaining)
+                    for pidfd in readable:
+                        del pidfds[pidfd]
+                        os.close(pidfd)
+                return True
+            finally:
+                for pidfd in pidfds:
+                    os.close(pidfd)
+    except OSError:
+        pass  # No permission to watch a process, or unsupported kernel; poll instead
+    return all(_poll_for_process_exit(pid, deadline - time.monotonic()) for pid in pids)
+
+
+def _poll_for_process_exit(pid: int, timeout: float) -> bool:
+    """Wait for a process to exit by polling it with signal 0.
+
+    Args:
+        pid: Process ID to wait for.
+        timeout: Maximum seconds to wait.
+
+    Returns:
+        True if process exited, False if timeout reached.
+    """
+    deadline = time.monotonic() + timeout
+    # Most processes exit soon after being asked to, so poll quickly at
+    # first and back off toward a 0.5s cadence.
+    interval = PROCESS_EXIT_POLL_MIN_SEC
+    while time.monotonic() < deadline:
+        try:
+            os.kill(pid, 0)  # Check if process is still alive (doesn't actually kill)
+            time.sleep(interval)
+            interval = min(interval * 2, PROCESS_EXIT_POLL_MAX_SEC)
+        except ProcessLookupError:
+            return True  # Process exited
+        except PermissionError:
+            return True  # Can't check, assume exited
+    return False  # Timeout
+
+
+def _run(argv: list[str], text: bool = False) -> subprocess.CompletedProcess:
+    """Run a short-lived helper tool and capture its output.
+
+    close_fds=False and an absolute argv[0] let subprocess use posix_spawn
+    instead of fork+exec, which matters as shutdown launches many of these.
+
+    Args:
+        argv: Command line, starting with an absolute executable path.
+        text: If True, decode stdout and stderr as text.
+
+    Returns:
+        The completed process; a non-zero exit status is not an error here.
+    """
+    return subprocess.run(argv, capture_output=True, text=text, check=False, close_fds=False)
+
+
+def _pids_of(process_name: str) -> list[int] | None:
+    """Look up the PIDs of processes with exactly this name.
+
+    The name is matched literally (regex characters are escaped) against
+    the executable name the kernel records, not the app's display name.
+
+    Args:
+        process_name: Process name as the kernel records it (e.g., "QuickTime Player").
+
+    Returns:
+        Matching PIDs (empty if none), or None if they cannot be looked up
+        (name too long for pgrep to match, or pgrep unavailable).
+    """
+    if len(process_name) > PGREP_NAME_MAX:
+        return None
+    try:
+        result = _run([PGREP_BIN, "-x", _ERE_SPECIAL.sub(r"\\\g<0>", process_name)])
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode == 1:
+        return []  # No process matched
+    if result.returncode != 0:
+        return None
+    return [int(pid) for pid in result.stdout.split()]
 
 
 def quit_app(
@@ -84,46 +289,41 @@ def quit_app(
     """
     process_name = process_name or app_name
 
-    if not is_app_running(process_name):
-        return OperationResult(
-            success=True,
-            message=f"{app_name} is not running",
-        )
-
-    script = f'''
-    tell application "{app_name}"
-        quit
-    end tell
-    '''
+    # Looked up before the quit is sent, so the exit can be waited on
+    pids = _pids_of(process_name) if wait_for_termination else None
 
     try:
-        result = subprocess.run(
-            ["osascript", "-e", script],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        success, stdout, stderr = run_applescript(_quit_script(app_name, process_name))
+        # The app may be quitting now, so a cached "running" is no longer trusted
+        invalidate_app_cache(process_name)
 
-        if result.returncode != 0:
+        if not success:
             return OperationResult(
                 success=False,
-                message=f"Failed to quit {app_name}: {result.stderr.strip()}",
-                details={"stderr": result.stderr.strip()},
+                message=f"Failed to quit {app_name}: {stderr}",
+                details={"stderr": stderr},
+            )
+
+        if stdout == APP_NOT_RUNNING:
+            return OperationResult(
+                success=True,
+                message=f"{app_name} is not running",
             )
 
         # Optionally wait for app to fully terminate
         if wait_for_termination:
-            poll_interval = 0.5
-            elapsed = 0.0
-            while elapsed < termination_timeout:
-                if not is_app_running(process_name):
-                    return OperationResult(
-                        success=True,
-                        message=f"{app_name} quit and terminated successfully",
-                        details={"termination_time_seconds": elapsed},
-                    )
-                time.sleep(poll_interval)
-                elapsed += poll_interval
+            started = time.monotonic()
+            if pids:
+                # Woken by the kernel when the last process exits; no osascript polling
+                terminated = wait_for_process_exits(pids, termination_timeout)
+            else:
+                terminated = _poll_for_app_exit(process_name, termination_timeout)
+            if terminated:
+                return OperationResult(
+                    success=True,
+                    message=f"{app_name} quit and terminated successfully",
+                    details={"termination_time_seconds": time.monotonic() - started},
+                )
 
             # Timeout - app still running
             return OperationResult(
@@ -144,24 +344,76 @@ def quit_app(
         )
 
 
+def _poll_for_app_exit(process_name: str, timeout: float, poll_interval: float = 0.5) -> bool:
+    """Wait for an application to exit by asking System Events repeatedly.
+
+    Used when the app's PIDs could not be looked up.
+
+    Args:
+        process_name: Name of the process to wait for.
+        timeout: Maximum seconds to wait.
+        poll_interval: Seconds between checks.
+
+    Returns:
+        True if the app exited, False if timeout reached.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if not is_app_running(process_name):
+            return True
+        time.sleep(poll_interval)
+    return False
+
+
+@cache
+def _compile_applescript(script: str) -> Any | None:
+    """Compile an AppleScript in-process with NSAppleScript, once per script source.
+
+    Args:
+        script: AppleScript code to compile.
+
+    Returns:
+        Compiled NSAppleScript, or None if pyobjc is unavailable or the script
+        does not compile (osascript then reports the error).
+    """
+    try:
+        from Foundation import NSAppleScript
+    except ImportError:
+        return None
+
+    compiled = NSAppleScript.alloc().initWithSource_(script)
+    ok, _ = compiled.compileAndReturnError_(None)
+    return compiled if ok else None
+
+
 def run_applescript(script: str) -> tuple[bool, str, str]:
     """Run an AppleScript and return results.
 
+    On the main thread with pyobjc installed, the script runs in this process
+    (NSAppleScript may only be used from the main thread), which skips
+    launching osascript and compiles each distinct script only once.
+    Otherwise it runs through osascript.
+
     Args:
         script: AppleScript code to execute.
 
     Returns:
         Tuple of (success, stdout, stderr).
     """
+    compiled = _compile_applescript(script) if threading.current_thread() is threading.main_thread() else None
+    if compiled is not None:
+        from Foundation import NSAppleScriptErrorMessage
+
+        result, error = compiled.executeAndReturnError_(None)
+        if result is None:
+            return (False, "", str(error.get(NSAppleScriptErrorMessage, error)))
+        # stringValue() is None for results with no text form (e.g., no result)
+        return (True, (result.stringValue() or "").strip(), "")
+
     try:
-        result = subprocess.run(
-            ["osascript", "-e", script],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        result = _run([OSASCRIPT_BIN, "-e", script], text=True)
         return (result.returncode == 0, result.stdout.strip(), result.stderr.strip())
-    except subprocess.SubprocessError as e:
+    except (subprocess.SubprocessError, OSError) as e:
         return (False, "", str(e))
 
 
@@ -180,12 +432,13 @@ def wait_for_file(
     Returns:
         True if file appeared, False if timeout.
     """
-    start_time = time.time()
-    while time.time() - start_time < timeout_seconds:
-        if file_path.exists():
-            return True
-        time.sleep(poll_interval)
-    return False
+    deadline = time.monotonic() + timeout_seconds
+    while not file_path.exists():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(remaining, poll_interval))
+    return True
 
 
 def wait_for_files_stable(
@@ -193,41 +446,59 @@ def wait_for_files_stable(
     pattern: str,
     timeout_seconds: float = 10.0,
     stability_seconds: float = 1.0,
+    poll_interval: float = 0.5,
 ) -> list[Path]:
     """Wait for files matching pattern to appear and stabilize (stop growing).
 
+    Between checks the wait sleeps for poll_interval, or less when a seen
+    file could become stable for stability_seconds sooner; a file written in
+    the meantime shows a new size at that check and starts its stability
+    period again.
+
     Args:
         directory: Directory to search in.
-        pattern: Glob pattern for files.
+        pattern: Glob pattern for file names in directory (e.g., "*.mov").
         timeout_seconds: Maximum time to wait.
         stability_seconds: Time file size must be stable.
+        poll_interval: Longest time between checks.
 
     Returns:
         List of stable files found.
     """
-    start_time = time.time()
-    last_sizes: dict[Path, int] = {}
-    stable_since: dict[Path, float] = {}
-
-    while time.time() - start_time < timeout_seconds:
-        current_files = list(directory.glob(pattern))
-
-        for file_path in current_files:
-            try:
-                current_size = file_path.stat().st_size
-            except OSError:
-                continue
-
-            if file_path not in last_sizes or last_sizes[file_path] != current_size:
-                last_sizes[file_path] = current_size
-                stable_since[file_path] = time.time()
+    deadline = time.monotonic() + timeout_seconds
+    # Keyed by DirEntry.path strings; Paths are built only for the result
+    last_sizes: dict[str, int] = {}
+    stable_since: dict[str, float] = {}
+
+    while True:
+        now = time.monotonic()
+        current_files: list[str] = []
+        try:
+            # One directory read per check; names are matched before anything is stat'ed
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not fnmatchcase(entry.name, pattern):
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                        current_size = entry.stat().st_size
+                    except OSError:
+                        continue
+                    current_files.append(entry.path)
+                    if last_sizes.get(entry.path) != current_size:
+                        last_sizes[entry.path] = current_size
+                        stable_since[entry.path] = now
+        except OSError:
+            pass  # Directory missing or unreadable; nothing found this time
 
         # Check if all found files are stable
-        stable_files = [f for f in current_files if f in stable_since and time.time() - stable_since[f] >= stability_seconds]
+        stable_files = [Path(f) for f in current_files if now - stable_since[f] >= stability_seconds]
 
         if stable_files:
             return stable_files
+        if now >= deadline:
+            return []
 
-        time.sleep(0.5)
-
-    return []
+        next_check = min((stable_since[f] + stability_seconds for f in current_files), default=deadline)
+        time.sleep(max(0.0, min(next_check, deadline, now + poll_interval) - time.monotonic()))
@@ -4,11 +4,34 @@
 
 from __future__ import annotations
 
+import atexit
 import json
-from datetime import UTC, datetime
+import os
+import queue
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def _dumps_line(entry: dict[str, Any]) -> bytes:
+    """Serialize an entry as one compact UTF-8 JSON line (orjson when available).
+
+    The stdlib fallback uses the same compact separators and unescaped
+    non-ASCII output as orjson, so log lines look identical either way.
+    """
+    if orjson is not None:
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(entry, separators=(",", ":"), ensure_ascii=False).encode("utf-8") + b"\n"
 
 
 class ActionStatus(str, Enum):
@@ -36,8 +59,23 @@ class ActionType(str, Enum):
     ERROR = "error"
 
 
+# Member -> value string; a dict lookup skips the Enum.value descriptor on every entry
+_ACTION_VALUES: dict[ActionType, str] = {member: member.value for member in ActionType}
+_STATUS_VALUES: dict[ActionStatus, str] = {member: member.value for member in ActionStatus}
+
+
 class SessionLogger:
-    """Logger that writes actions to a JSONL file with timestamps."""
+    """Logger that writes actions to a JSONL file with timestamps.
+
+    log() serializes the entry and hands it to a background writer thread,
+    so callers never wait on disk I/O. The writer keeps the file open and
+    writes each burst of queued entries in one call. Entries logged inside
+    batch() are queued together. flush() waits for queued entries to reach
+    the file (log_failed() and log_error() do so themselves); use the logger
+    as a context manager (or call close(), which also runs at exit) to sync
+    the file to disk when done. Write errors are reported on stderr and
+    re-raised from the next flush() or close().
+    """
 
     def __init__(self, session_dir: Path, log_filename: str = "log.jsonl") -> None:
         """Initialize the logger.
@@ -48,15 +86,142 @@ class SessionLogger:
         """
         self.session_dir = Path(session_dir)
         self.log_file = self.session_dir / log_filename
+        self._fh: BinaryIO | None = None
+        self._queue: queue.SimpleQueue[bytes | threading.Event | None] = queue.SimpleQueue()
+        self._writer: threading.Thread | None = None
+        self._write_error: OSError | None = None
+        self._batch: list[bytes] | None = None
+        # (second, formatted prefix), replaced as one tuple so the pair always matches
+        self._ts_cache: tuple[int, str] = (-1, "")
         self._ensure_dir()
 
     def _ensure_dir(self) -> None:
         """Ensure the session directory exists."""
         self.session_dir.mkdir(parents=True, exist_ok=True)
 
+    def _open(self) -> None:
+        """Open the log file, start the writer thread, and register close() to run at exit."""
+        if self._fh is not None:
+            return
+        self._fh = open(self.log_file, "ab")
+        self._writer = threading.Thread(target=self._drain, args=(self._fh,), name=f"SessionLogger({self.log_file.name})", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _drain(self, fh: BinaryIO) -> None:
+        """Writer thread: append queued entries until the None sentinel arrives.
+
+        Args:
+            fh: Log file owned by this thread until the sentinel.
+        """
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    try:
+                        fh.flush()
+                        os.fsync(fh.fileno())
+                    finally:
+                        fh.close()
+                    return
+                if isinstance(item, threading.Event):
+                    fh.flush()
+                    item.set()
+                else:
+                    fh.write(item)
+                    # Entries queued together go out in one write
+                    if self._queue.empty():
+                        fh.flush()
+            except OSError as e:
+                # Print to stderr as fallback since we can't log
+                print(f"ERROR: Failed to write log entry to {self.log_file}: {e}", file=sys.stderr)
+                self._write_error = e
+                if isinstance(item, threading.Event):
+                    item.set()
+                elif item is None:
+                    return
+
+    def _raise_write_error(self) -> None:
+        """Re-raise (once) any error the writer thread hit."""
+        error, self._write_error = self._write_error, None
+        if error is not None:
+            raise error
+
+    def flush(self) -> None:
+        """Wait until all queued entries have been written to the log file.
+
+        Raises:
+            OSError: If writing fails (disk full, permission denied, etc.).
+        """
+        if self._fh is None:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+        self._raise_write_error()
+
+    def close(self) -> None:
+        """Write queued entries, sync and close the log file (a later log() reopens it).
+
+        Raises:
+            OSError: If writing fails (disk full, permission denied, etc.).
+        """
+        if self._fh is None:
+            return
+        self._queue.put(None)
+        self._writer.join()
+        self._fh = None
+        self._writer = None
+        atexit.unregister(self.close)
+        self._raise_write_error()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Hold entries logged in the block and write them in one call on exit.
+
+        Entries are written even if the block raises. A nested batch() joins
+        the enclosing one. Failures (log_failed, log_error) are not held: they
+        are written at once, together with the entries batched before them.
+        """
+        if self._batch is not None:
+            yield
+            return
+        self._batch = []
+        try:
+            yield
+        finally:
+            lines, self._batch = self._batch, None
+            if lines:
+                self._write(b"".join(lines))
+
+    def _write_through(self) -> None:
+        """Write entries batched so far, then wait until everything queued is on disk."""
+        if self._batch:
+            lines, self._batch = self._batch, []
+            self._write(b"".join(lines))
+        self.flush()
+
+    def _write(self, data: bytes) -> None:
+        """Queue data for the writer thread, opening the log file on first use."""
+        self._open()
+        self._queue.put(data)
+
+    def __enter__(self) -> SessionLogger:
+        """Return the logger; the file is opened by the first log()."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the log file."""
+        self.close()
+
     def _get_timestamp(self) -> str:
         """Get current UTC timestamp in ISO 8601 format with milliseconds."""
-        return datetime.now(UTC).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+        sec, ns = divmod(time.time_ns(), 1_000_000_000)
+        cached_sec, prefix = self._ts_cache
+        if sec != cached_sec:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+            self._ts_cache = (sec, prefix)
+        return f"{prefix}.{ns // 1_000_000:03d}Z"
 
     def log(
         self,
@@ -78,8 +243,8 @@ class SessionLogger:
         """
         entry = {
             "timestamp": self._get_timestamp(),
-            "action": action.value,
-            "status": status.value,
+            "action": _ACTION_VALUES[action],
+            "status": _STATUS_VALUES[status],
         }
 
         if message:
@@ -88,8 +253,11 @@ class SessionLogger:
         if details:
             entry["details"] = details
 
-        with open(self.log_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        line = _dumps_line(entry)
+        if self._batch is not None:
+            self._batch.append(line)
+        else:
+            self._write(line)
 
         return entry
 
@@ -102,15 +270,17 @@ class SessionLogger:
         return self.log(action, ActionStatus.SUCCESS, message, details)
 
     def log_failed(self, action: ActionType, message: str | None = None, details: dict[str, Any] | None = None) -> dict[str, Any]:
-        """Log a failed action."""
-        return self.log(action, ActionStatus.FAILED, message, details)
+        """Log a failed action and wait until it is written, even inside batch() (kept for diagnostics)."""
+        entry = self.log(action, ActionStatus.FAILED, message, details)
+        self._write_through()
+        return entry
 
     def log_skipped(self, action: ActionType, message: str | None = None, details: dict[str, Any] | None = None) -> dict[str, Any]:
         """Log a skipped action."""
         return self.log(action, ActionStatus.SKIPPED, message, details)
 
     def log_error(self, error: Exception, context: str | None = None) -> dict[str, Any]:
-        """Log an error with full exception details."""
+        """Log an error with full exception details and wait until it is written, even inside batch()."""
         details = {
             "error_type": type(error).__name__,
             "error_message": str(error),
@@ -118,4 +288,6 @@ class SessionLogger:
         if context:
             details["context"] = context
 
-        return self.log(ActionType.ERROR, ActionStatus.FAILED, str(error), details)
+        entry = self.log(ActionType.ERROR, ActionStatus.FAILED, str(error), details)
+        self._write_through()
+        return entry
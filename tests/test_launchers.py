@@ -0,0 +1,46 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Club Maquis
+"""Tests for the recording setup launchers."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+
+import pytest
+
+from scripts.setup import launchers
+from scripts.setup.launchers import _system_profiler_lists
+
+
+class TestSystemProfilerLists:
+    """Test streaming the system_profiler USB listing."""
+
+    @pytest.fixture
+    def profiler(self, monkeypatch):
+        """Replace system_profiler with a Python one-liner given by the test."""
+
+        def use(code):
+            monkeypatch.setattr(launchers, "SYSTEM_PROFILER_CMD", [sys.executable, "-c", code])
+
+        return use
+
+    def test_stops_at_first_match(self, profiler):
+        """A match is reported without waiting for the listing to end."""
+        profiler("import sys, time; print('Launchpad Mini MK3', flush=True); time.sleep(30)")
+        started = time.monotonic()
+        assert _system_profiler_lists("Launchpad", timeout=10) is True
+        assert time.monotonic() - started < 5.0
+
+    def test_no_match(self, profiler):
+        """A listing without the needle gives False."""
+        profiler("print('USB Keyboard')")
+        assert _system_profiler_lists("Launchpad", timeout=10) is False
+
+    def test_large_stderr_does_not_stall(self, profiler):
+        """Plenty of stderr output is reported as an error, not a timeout."""
+        profiler("import sys; sys.stderr.write('x' * 1_000_000 + 'oops'); sys.exit(1)")
+        with pytest.raises(subprocess.CalledProcessError) as excinfo:
+            _system_profiler_lists("Launchpad", timeout=5)
+        assert excinfo.value.stderr.endswith("oops")
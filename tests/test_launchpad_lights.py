@@ -4,23 +4,39 @@
 
 from __future__ import annotations
 
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from scripts.setup.launchpad_lights import (
+    _PORT_NAME_CACHE,
     CHASE_SPEED,
+    CLEAR_ALL_SYSEX,
+    DOT_FORBIDDEN,
     LAUNCHPAD_PORT_PATTERN,
+    NOTE_INDEX,
+    NOTE_LUT,
+    PACE_SPIN_SEC,
     PAD_GRID,
     PROGRAMMER_MODE,
     SYSEX_HEADER,
     WARM_COLORS,
     LaunchpadLights,
+    _pace,
+    raise_thread_priority,
     start_cat_lights,
     stop_cat_lights,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_port_cache():
+    """Start every test without a remembered Launchpad port name."""
+    _PORT_NAME_CACHE.clear()
+
+
 class TestLaunchpadLightsConstants:
     """Test module constants are correctly defined."""
 
@@ -45,6 +61,13 @@ class TestLaunchpadLightsConstants:
             for note in row:
                 assert 11 <= note <= 88
 
+    def test_note_lut_matches_pad_grid(self):
+        """Flat lookup table maps row * 8 + col to the same note as PAD_GRID."""
+        for r in range(8):
+            for c in range(8):
+                assert NOTE_LUT[(r << 3) | c] == PAD_GRID[r][c] == 81 - 10 * r + c
+                assert NOTE_INDEX[PAD_GRID[r][c]] == r * 8 + c
+
     def test_warm_colors_not_empty(self):
         """Warm colors palette should have colors defined."""
         assert len(WARM_COLORS) > 0
@@ -62,59 +85,169 @@ class TestLaunchpadLightsConstants:
 class TestLaunchpadLightsNoDevice:
     """Test LaunchpadLights behavior when no device is connected."""
 
-    def test_connect_without_mido(self):
+    def test_connect_without_mido(self, monkeypatch):
         """Connect should fail gracefully if mido is not available."""
-        with patch("scripts.setup.launchpad_lights.mido", None):
-            lights = LaunchpadLights()
-            assert lights.connect() is False
-
-    def test_connect_no_launchpad_found(self):
-        """Connect should fail if no Launchpad port exists."""
-        mock_mido = MagicMock()
-        mock_mido.get_output_names.return_value = ["Other MIDI Device"]
+        monkeypatch.setattr("scripts.setup.launchpad_lights.mido", None)
+        assert LaunchpadLights().connect() is False
 
-        with patch("scripts.setup.launchpad_lights.mido", mock_mido):
-            lights = LaunchpadLights()
-            assert lights.connect() is False
-
-    def test_start_without_connection(self):
-        """Start should fail if connect fails."""
+    @pytest.mark.parametrize("port_names", [["Other MIDI Device"], []], ids=["other-device", "no-ports"])
+    @pytest.mark.parametrize("method", ["connect", "start"])
+    def test_fails_without_launchpad_port(self, monkeypatch, method, port_names):
+        """Connect (and so start) should fail if no Launchpad port exists."""
         mock_mido = MagicMock()
-        mock_mido.get_output_names.return_value = []
-
-        with patch("scripts.setup.launchpad_lights.mido", mock_mido):
-            lights = LaunchpadLights()
-            assert lights.start() is False
+        mock_mido.get_output_names.return_value = port_names
+        monkeypatch.setattr("scripts.setup.launchpad_lights.mido", mock_mido)
+        assert getattr(LaunchpadLights(), method)() is False
 
 
 class TestLaunchpadLightsWithMock:
     """Test LaunchpadLights with mocked MIDI port."""
 
-    @pytest.fixture
-    def mock_mido(self):
-        """Create a mock mido module."""
+    @pytest.fixture(autouse=True)
+    def mock_mido(self, monkeypatch):
+        """Patch in a fresh mock mido module that lists a Launchpad port."""
         mock = MagicMock()
         mock.get_output_names.return_value = [f"{LAUNCHPAD_PORT_PATTERN} LPMiniMK3 MIDI"]
-        mock.Message = MagicMock()
+        monkeypatch.setattr("scripts.setup.launchpad_lights.mido", mock)
         return mock
 
     def test_connect_success(self, mock_mido):
         """Connect should succeed when Launchpad is found."""
-        with patch("scripts.setup.launchpad_lights.mido", mock_mido):
+        lights = LaunchpadLights()
+        assert lights.connect() is True
+        mock_mido.open_output.assert_called_once()
+
+    def test_reconnect_skips_port_enumeration(self, mock_mido):
+        """A second connect reuses the resolved port name."""
+        LaunchpadLights().connect()
+        assert LaunchpadLights().connect() is True
+        assert mock_mido.get_output_names.call_count == 1
+        assert mock_mido.open_output.call_count == 2
+
+    def test_reconnect_reenumerates_when_cached_port_fails(self, mock_mido):
+        """A stale cached port name falls back to enumeration."""
+        LaunchpadLights().connect()
+        mock_mido.open_output.side_effect = [OSError("gone"), MagicMock()]
+        assert LaunchpadLights().connect() is True
+        assert mock_mido.get_output_names.call_count == 2
+
+    def test_sends_raw_bytes_through_rtmidi_handle(self, mock_mido):
+        """With an rtmidi-backed port, messages go out as raw bytes without mido.Message."""
+
+        class FakeMidiOut:
+            send_message = MagicMock()
+
+        mock_port = MagicMock()
+        mock_port._rt = FakeMidiOut()
+        mock_mido.open_output.return_value = mock_port
+
+        with patch("scripts.setup.launchpad_lights.rtmidi", MagicMock(MidiOut=FakeMidiOut)):
             lights = LaunchpadLights()
-            assert lights.connect() is True
-            mock_mido.open_output.assert_called_once()
+            lights.connect()
+            mock_mido.Message.reset_mock()
+            lights._send_note_on(PAD_GRID[0][0], WARM_COLORS[0], 2)
+            lights._send_sysex([0x00, 0x7F])
+            lights._clear_all_leds()
+            assert mock_mido.Message.call_count == 0
+            assert mock_port.send.call_count == 0
+            sent = [list(c.args[0]) for c in FakeMidiOut.send_message.call_args_list]
+            assert sent[:2] == [[0x92, PAD_GRID[0][0], WARM_COLORS[0]], [0xF0, *SYSEX_HEADER, 0x00, 0x7F, 0xF7]]
+            assert sent[2] == [0xF0, *SYSEX_HEADER, *CLEAR_ALL_SYSEX, 0xF7]
 
     def test_disconnect_closes_port(self, mock_mido):
         """Disconnect should close the MIDI port."""
         mock_port = MagicMock()
         mock_mido.open_output.return_value = mock_port
 
-        with patch("scripts.setup.launchpad_lights.mido", mock_mido):
-            lights = LaunchpadLights()
-            lights.connect()
-            lights.disconnect()
-            mock_port.close.assert_called_once()
+        lights = LaunchpadLights()
+        lights.connect()
+        lights.disconnect()
+        mock_port.close.assert_called_once()
+
+    def test_disconnect_flushes_logger(self, mock_mido):
+        """Disconnect should push buffered log entries to disk."""
+        logger = MagicMock()
+        lights = LaunchpadLights(logger)
+        lights.connect()
+        lights.disconnect()
+        logger.flush.assert_called_once()
+
+    def test_stop_wakes_pattern_thread(self, mock_mido):
+        """stop() interrupts the frame wait instead of waiting out the pattern."""
+        mock_mido.open_output.return_value = MagicMock()
+
+        lights = LaunchpadLights()
+        assert lights.start(pattern="hunt")
+        assert lights.running
+        started = time.monotonic()
+        lights.stop()
+        assert not lights.running
+        assert time.monotonic() - started < 1.0
+
+    def test_clear_all_leds_sends_one_sysex(self, mock_mido):
+        """Clearing turns off the grid and top row in a single SysEx."""
+        mock_port = MagicMock()
+        mock_mido.open_output.return_value = mock_port
+
+        lights = LaunchpadLights()
+        lights.connect()
+        mock_port.send.reset_mock()
+        lights._clear_all_leds()
+        assert mock_port.send.call_count == 1
+        data = mock_mido.Message.call_args.kwargs["data"]
+        assert data[: len(SYSEX_HEADER) + 1] == SYSEX_HEADER + [0x03]
+        assert len(data) == len(SYSEX_HEADER) + 1 + 72 * 3
+
+    def test_clear_all_leds_skips_when_already_clear(self, mock_mido):
+        """A second clear sends nothing until an LED is lit again."""
+        mock_port = MagicMock()
+        mock_mido.open_output.return_value = mock_port
+
+        lights = LaunchpadLights()
+        lights.connect()
+        lights._clear_all_leds()
+        mock_port.send.reset_mock()
+        lights._clear_all_leds()
+        assert mock_port.send.call_count == 0
+        lights._set_led(PAD_GRID[0][0], WARM_COLORS[0])
+        lights._clear_all_leds()
+        assert mock_port.send.call_count == 2
+
+    def test_note_on_messages_are_reused(self, mock_mido):
+        """Repeated Note On sends reuse one cached mido.Message."""
+        mock_port = MagicMock()
+        mock_mido.open_output.return_value = mock_port
+
+        lights = LaunchpadLights()
+        lights.connect()
+        mock_mido.Message.reset_mock()
+        lights._send_note_on(PAD_GRID[0][0], WARM_COLORS[0])
+        lights._send_note_on(PAD_GRID[0][0], WARM_COLORS[0])
+        assert mock_mido.Message.call_count == 1
+        assert mock_port.send.call_count == 2
+
+    def test_blit_sends_only_changed_pads(self, mock_mido):
+        """Changed pads go out in one SysEx; re-showing a frame sends nothing."""
+        mock_port = MagicMock()
+        mock_mido.open_output.return_value = mock_port
+
+        lights = LaunchpadLights()
+        lights.connect()
+        frame, pulse = bytearray(64), bytearray(64)
+        frame[0], frame[63] = WARM_COLORS[0], WARM_COLORS[1]
+        pulse[0] = 1
+        lights._blit(frame, pulse)
+        assert mock_port.send.call_count == 1
+        data = mock_mido.Message.call_args.kwargs["data"]
+        assert list(data) == SYSEX_HEADER + [0x03, 2, PAD_GRID[0][0], WARM_COLORS[0], 0, PAD_GRID[7][7], WARM_COLORS[1]]
+
+        mock_port.send.reset_mock()
+        lights._blit(frame, pulse)
+        assert mock_port.send.call_count == 0
+
+        frame[63] = 0
+        lights._blit(frame, pulse)
+        assert mock_port.send.call_count == 1
 
 
 class TestConvenienceFunctions:
@@ -136,3 +269,75 @@ class TestConvenienceFunctions:
         mock_lights = MagicMock()
         stop_cat_lights(mock_lights)
         mock_lights.disconnect.assert_called_once()
+
+
+class TestPace:
+    """Test fixed-cadence frame pacing."""
+
+    def test_sleeps_until_next_deadline(self):
+        """_pace sleeps the time left in the frame, less the spin margin, and advances by one period."""
+        with patch("scripts.setup.launchpad_lights.time") as mock_time:
+            mock_time.monotonic.side_effect = [10.03, 10.1]
+            assert _pace(10.0, 0.1) == pytest.approx(10.1)
+            mock_time.sleep.assert_called_once_with(pytest.approx(0.07 - PACE_SPIN_SEC))
+
+    def test_resyncs_when_far_behind(self):
+        """_pace restarts the cadence instead of rushing through missed frames."""
+        with patch("scripts.setup.launchpad_lights.time") as mock_time:
+            mock_time.monotonic.return_value = 10.5
+            assert _pace(10.0, 0.1) == 10.5
+            mock_time.sleep.assert_not_called()
+
+    def test_stop_event_ends_wait(self):
+        """A set stop event ends the frame wait without sleeping the full period."""
+        stop = threading.Event()
+        stop.set()
+        started = time.monotonic()
+        _pace(time.monotonic(), 5.0, stop)
+        assert time.monotonic() - started < 1.0
+
+
+class TestHuntHelpers:
+    """Test the snake/dot movement helpers used by the hunt pattern."""
+
+    def test_spawn_dot_avoids_snake_and_corners(self):
+        """Spawned dots never land on the snake or a forbidden corner."""
+        lights = LaunchpadLights()
+        lights._rng.seed(0)
+        snake = [(3, 3), (3, 2), (3, 1), (3, 0), (2, 0)]
+        for _ in range(500):
+            dot = lights._spawn_dot_away_from([r * 8 + c for r, c in snake])
+            assert dot not in snake
+            assert dot not in DOT_FORBIDDEN
+
+    def test_blit_cells_compares_only_listed_pads(self):
+        """With cells given, _blit only checks and records those pads."""
+        lights = LaunchpadLights()
+        sent = []
+        lights._send_raw = lambda data: sent.append(list(data))
+        frame, pulse = bytearray(64), bytearray(64)
+        frame[0] = frame[9] = WARM_COLORS[0]
+        lights._blit(frame, pulse, cells=[9])
+        assert sent == [[0xF0, *SYSEX_HEADER, 0x03, 0, PAD_GRID[1][1], WARM_COLORS[0], 0xF7]]
+        assert lights._frame[9] == WARM_COLORS[0]
+        assert lights._frame[0] == 0
+
+
+class TestRaiseThreadPriority:
+    """Test the animation thread priority helper."""
+
+    def test_noop_off_macos(self):
+        """Other platforms are left at normal priority."""
+        with patch("scripts.setup.launchpad_lights.sys.platform", "linux"):
+            assert raise_thread_priority() is False
+
+    def test_sets_user_interactive_qos_on_macos(self):
+        """On macOS the calling thread gets the USER_INTERACTIVE QoS class."""
+        libc = MagicMock()
+        libc.pthread_set_qos_class_self_np.return_value = 0
+        with (
+            patch("scripts.setup.launchpad_lights.sys.platform", "darwin"),
+            patch("scripts.setup.launchpad_lights.ctypes.CDLL", return_value=libc),
+        ):
+            assert raise_thread_priority() is True
+        libc.pthread_set_qos_class_self_np.assert_called_once_with(0x21, 0)
@@ -0,0 +1,215 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Club Maquis
+"""Tests for the JSONL session logger."""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from scripts.common import LOG_EXTENSIONS, LOG_FORMAT_ENV, LOG_FORMATS, make_logger, resolve_log_format
+from scripts.common.binlogger import MsgpackLogger, read_records
+from scripts.common.logger import LOG_SCHEMA_VERSION, JSONLLogger, _dumps
+from scripts.setup.recording import get_log_filename
+
+
+def read_entries(path):
+    """Parse every line of a JSONL file."""
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestJSONLLogger:
+    """Test JSONLLogger output and buffering."""
+
+    @pytest.fixture
+    def log_path(self, tmp_path):
+        """Path to a log file inside a not-yet-created directory."""
+        return tmp_path / "session" / "20250101T120000Z_log.jsonl"
+
+    def test_schema_written_first(self, log_path):
+        """A new log file starts with the schema entry."""
+        logger = JSONLLogger(log_path)
+        logger.close()
+        entries = read_entries(log_path)
+        assert len(entries) == 1
+        assert entries[0]["action"] == "log_schema"
+        assert entries[0]["schema"]["version"] == LOG_SCHEMA_VERSION
+
+    def test_schema_not_rewritten_for_existing_file(self, log_path):
+        """Reopening an existing log appends without a second schema entry."""
+        JSONLLogger(log_path).close()
+        logger = JSONLLogger(log_path)
+        logger.log("app_launched", app="QuickTime Player")
+        logger.close()
+        actions = [e["action"] for e in read_entries(log_path)]
+        assert actions == ["log_schema", "app_launched"]
+
+    def test_entries_buffered_until_flush(self, log_path):
+        """Ordinary entries stay in memory until flush() is called."""
+        logger = JSONLLogger(log_path)
+        logger.log("app_launched", app="QuickTime Player")
+        assert len(read_entries(log_path)) == 1
+        logger.flush()
+        entries = read_entries(log_path)
+        assert entries[-1] == {"timestamp": entries[-1]["timestamp"], "action": "app_launched", "app": "QuickTime Player"}
+        logger.close()
+
+    def test_milestone_actions_flush_immediately(self, log_path):
+        """Milestone actions such as setup_complete reach disk right away."""
+        logger = JSONLLogger(log_path)
+        logger.log("app_launched", app="QuickTime Player")
+        logger.log("setup_complete", failures=0)
+        actions = [e["action"] for e in read_entries(log_path)]
+        assert actions == ["log_schema", "app_launched", "setup_complete"]
+        logger.close()
+
+    def test_known_action_without_fields(self, log_path):
+        """Known actions with no extra fields use the pre-encoded fast path."""
+        logger = JSONLLogger(log_path)
+        entry = logger.log("shutdown_started")
+        logger.close()
+        assert read_entries(log_path)[-1] == entry == {"timestamp": entry["timestamp"], "action": "shutdown_started"}
+
+    def test_context_manager_flushes_on_exit(self, log_path):
+        """Leaving the with-block writes pending entries and closes the file."""
+        with JSONLLogger(log_path) as logger:
+            logger.log("app_launched", app="QuickTime Player")
+        assert read_entries(log_path)[-1]["app"] == "QuickTime Player"
+
+    def test_ns_timestamps(self, log_path):
+        """ns_timestamps=True stamps every entry with an integer "t" field."""
+        with JSONLLogger(log_path, ns_timestamps=True) as logger:
+            logger.log("app_launched", app="QuickTime Player")
+            logger.log("setup_complete")
+        entries = read_entries(log_path)
+        assert [e["action"] for e in entries] == ["log_schema", "app_launched", "setup_complete"]
+        for entry in entries:
+            assert isinstance(entry["t"], int)
+            assert "timestamp" not in entry
+
+    def test_log_after_close_reopens(self, log_path):
+        """Logging after close() reopens the file instead of dropping entries."""
+        logger = JSONLLogger(log_path)
+        logger.close()
+        logger.log("app_launched", app="Google Chrome")
+        logger.close()
+        assert read_entries(log_path)[-1]["app"] == "Google Chrome"
+
+    def test_concurrent_loggers_keep_every_entry(self, log_path):
+        """Entries logged from several threads all reach the file intact."""
+        logger = JSONLLogger(log_path)
+
+        def worker(n):
+            for i in range(50):
+                logger.log("app_launched", worker=n, i=i)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        logger.close()
+        entries = read_entries(log_path)[1:]
+        assert len(entries) == 200
+        for n in range(4):
+            assert [e["i"] for e in entries if e["worker"] == n] == list(range(50))
+
+
+class TestDumps:
+    """Test the JSON serialization helper."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_compact_utf8_output(self, use_orjson):
+        """Both backends emit compact JSON with unescaped non-ASCII text."""
+        entry = {"action": "app_launched", "app": "Caf\u00e9"}
+        expected = '{"action":"app_launched","app":"Caf\u00e9"}'.encode()
+        if use_orjson:
+            pytest.importorskip("orjson")
+            assert _dumps(entry) == expected
+        else:
+            with patch("scripts.common.logger.orjson", None):
+                assert _dumps(entry) == expected
+
+
+class TestCompiledEncoder:
+    """Test that the optional Cython encoder matches the stdlib encoding."""
+
+    @pytest.fixture
+    def encode_entry(self):
+        """encode_entry from the compiled module (skipped when not built)."""
+        return pytest.importorskip("scripts.common._logger_fast").encode_entry
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "".join(map(chr, range(0x80))),
+            "Caf\u00e9 \u2028 \U0001f431",
+            None,
+            True,
+            False,
+            -42,
+            1.5,
+            ["a", {"b": None}],
+        ],
+        ids=["ascii", "non-ascii", "none", "true", "false", "int", "float", "nested"],
+    )
+    def test_matches_stdlib(self, encode_entry, value):
+        """Output is byte-identical to the compact stdlib json encoding."""
+        ts = "2025-01-01T12:30:00.123456+00:00"
+        with patch("scripts.common.logger.orjson", None):
+            expected = _dumps({"timestamp": ts, "action": "app_launched", "value": value})
+        assert encode_entry(ts, "app_launched", {"value": value}) == expected
+
+    def test_lone_surrogate_rejected(self, encode_entry):
+        """Lone surrogates fail to encode, as they do with the stdlib."""
+        with pytest.raises(UnicodeEncodeError):
+            encode_entry("2025-01-01T12:30:00.123456+00:00", "app_launched", {"value": "\ud800"})
+
+
+class TestMakeLogger:
+    """Test the logger factory and the msgpack logger."""
+
+    def test_default_is_jsonl(self, tmp_path, monkeypatch):
+        """Without a format or env override, make_logger returns a JSONLLogger."""
+        monkeypatch.delenv(LOG_FORMAT_ENV, raising=False)
+        logger = make_logger(tmp_path / "log.jsonl")
+        logger.close()
+        assert type(logger) is JSONLLogger
+
+    def test_unknown_format_rejected(self, tmp_path):
+        """An unknown format raises ValueError."""
+        with pytest.raises(ValueError):
+            make_logger(tmp_path / "log.xml", fmt="xml")
+
+    def test_format_from_env(self, monkeypatch):
+        """The env var picks the format, which is also the log file extension."""
+        monkeypatch.setenv(LOG_FORMAT_ENV, "MsgPack")
+        assert resolve_log_format() == "msgpack"
+        assert resolve_log_format("jsonl") == "jsonl"
+
+    def test_unknown_env_format_rejected(self, monkeypatch):
+        """A bad env value is caught before any logger is created."""
+        monkeypatch.setenv(LOG_FORMAT_ENV, "xml")
+        with pytest.raises(ValueError):
+            resolve_log_format()
+
+    @pytest.mark.parametrize("fmt", sorted(LOG_FORMATS))
+    def test_log_filename_recognized_by_shutdown(self, fmt):
+        """Setup log files in every format carry an extension the shutdown scan reports."""
+        assert Path(get_log_filename("20250101T120000Z", fmt)).suffix in LOG_EXTENSIONS
+
+    def test_msgpack_round_trip(self, tmp_path, monkeypatch):
+        """The env var selects MsgpackLogger, whose records decode back to entries."""
+        pytest.importorskip("msgpack")
+        monkeypatch.setenv(LOG_FORMAT_ENV, "msgpack")
+        log_path = tmp_path / "log.msgpack"
+        with make_logger(log_path) as logger:
+            assert isinstance(logger, MsgpackLogger)
+            entry = logger.log("app_launched", app="QuickTime Player")
+        records = read_records(log_path.read_bytes())
+        assert [r["action"] for r in records] == ["log_schema", "app_launched"]
+        assert records[-1] == entry
@@ -0,0 +1,104 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Club Maquis
+"""Tests for the shutdown session logger."""
+
+from __future__ import annotations
+
+import json
+import re
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.clubmaquis import session_logger
+from src.clubmaquis.session_logger import ActionStatus, ActionType, SessionLogger, _dumps_line
+
+
+def read_entries(path):
+    """Parse every line of a JSONL file."""
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestSessionLogger:
+    """Test SessionLogger output and file handling."""
+
+    def test_entries_visible_after_flush(self, tmp_path):
+        """Entries reach the file by the time flush() returns, before close."""
+        with SessionLogger(tmp_path, "log.jsonl") as logger:
+            logger.log_start(ActionType.SESSION_END, "Starting shutdown sequence")
+            logger.log(ActionType.USER_CONFIRM, ActionStatus.SUCCESS, details={"n": 1})
+            logger.flush()
+            entries = read_entries(tmp_path / "log.jsonl")
+        assert [(e["action"], e["status"]) for e in entries] == [("session_end", "started"), ("user_confirm", "success")]
+        assert entries[1]["details"] == {"n": 1}
+
+    def test_log_after_close_reopens(self, tmp_path):
+        """Closing is not final; a later entry is appended to the same file."""
+        logger = SessionLogger(tmp_path, "log.jsonl")
+        logger.log_success(ActionType.FILE_MOVE)
+        logger.close()
+        logger.log_failed(ActionType.FILE_MOVE)
+        logger.close()
+        assert [e["status"] for e in read_entries(tmp_path / "log.jsonl")] == ["success", "failed"]
+
+    def test_batch_writes_entries_on_exit(self, tmp_path):
+        """Entries logged in a batch reach the file together when the block ends."""
+        log_file = tmp_path / "log.jsonl"
+        with SessionLogger(tmp_path, "log.jsonl") as logger:
+            logger.log_start(ActionType.SESSION_END)
+            logger.flush()
+            with logger.batch():
+                logger.log_success(ActionType.LAUNCHPAD_LIGHTS)
+                logger.log_success(ActionType.USER_PROMPT)
+                logger.flush()
+                assert len(read_entries(log_file)) == 1
+            logger.flush()
+            assert [e["action"] for e in read_entries(log_file)] == ["session_end", "launchpad_lights", "user_prompt"]
+
+    def test_batch_written_when_block_raises(self, tmp_path):
+        """An exception inside a batch does not lose the entries logged before it."""
+        logger = SessionLogger(tmp_path, "log.jsonl")
+        with pytest.raises(RuntimeError), logger.batch():
+            logger.log_skipped(ActionType.FILE_MOVE)
+            raise RuntimeError("boom")
+        logger.close()
+        assert [e["status"] for e in read_entries(tmp_path / "log.jsonl")] == ["skipped"]
+
+    def test_failures_written_immediately(self, tmp_path):
+        """log_failed() and log_error() return only once the entry is in the file."""
+        with SessionLogger(tmp_path, "log.jsonl") as logger:
+            logger.log_failed(ActionType.FILE_MOVE)
+            assert [e["status"] for e in read_entries(tmp_path / "log.jsonl")] == ["failed"]
+            logger.log_error(ValueError("bad"), context="move")
+            assert read_entries(tmp_path / "log.jsonl")[-1]["details"] == {"error_type": "ValueError", "error_message": "bad", "context": "move"}
+
+    def test_failures_not_held_by_batch(self, tmp_path):
+        """A failure inside a batch is written at once, after the entries batched before it."""
+        log_file = tmp_path / "log.jsonl"
+        with SessionLogger(tmp_path, "log.jsonl") as logger, logger.batch():
+            logger.log_start(ActionType.FILE_MOVE)
+            logger.log_failed(ActionType.FILE_MOVE)
+            assert [e["status"] for e in read_entries(log_file)] == ["started", "failed"]
+            logger.log_start(ActionType.USER_PROMPT)
+            logger.log_error(ValueError("bad"))
+            assert [e["status"] for e in read_entries(log_file)] == ["started", "failed", "started", "failed"]
+            logger.log_success(ActionType.USER_PROMPT)
+            logger.flush()
+            assert len(read_entries(log_file)) == 4
+        assert [e["status"] for e in read_entries(log_file)][-1] == "success"
+
+    def test_stdlib_fallback_matches_orjson_output(self, monkeypatch):
+        """Lines are byte-identical with or without orjson installed."""
+        entry = {"timestamp": "2025-01-01T00:00:00.000Z", "action": "file_move", "details": {"name": 'caf\u00e9 "x"\n', 1: [1, 2.5], "ok": None}}
+        line = _dumps_line(entry)
+        monkeypatch.setattr(session_logger, "orjson", None)
+        assert _dumps_line(entry) == line
+        assert line.endswith(b"\n") and b"\n" not in line[:-1]
+
+    def test_timestamp_format(self, tmp_path):
+        """Timestamps are UTC ISO 8601 with milliseconds and a Z suffix."""
+        before = datetime.now(UTC).replace(microsecond=0)
+        stamp = SessionLogger(tmp_path).log_success(ActionType.FILE_MOVE)["timestamp"]
+        assert re.fullmatch(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z", stamp)
+        parsed = datetime.fromisoformat(stamp.replace("Z", "+00:00"))
+        assert before <= parsed <= datetime.now(UTC) + timedelta(milliseconds=1)
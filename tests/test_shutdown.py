@@ -0,0 +1,358 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Club Maquis
+"""Tests for the shutdown script helpers."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from scripts.shutdown import main as shutdown_main
+from scripts.shutdown import utils as shutdown_utils
+from scripts.shutdown.main import find_session_files, get_expected_filenames, get_session_dir, stop_launchpad_lights, validate_session_id
+from scripts.shutdown.utils import (
+    PGREP_NAME_MAX,
+    _applescript_string,
+    _pids_of,
+    _quit_script,
+    invalidate_app_cache,
+    is_app_running,
+    wait_for_file,
+    wait_for_files_stable,
+    wait_for_process_exits,
+)
+
+
+class TestFindSessionFiles:
+    """Test session directory scanning."""
+
+    def test_lists_files_sorted_and_absolute(self, tmp_path):
+        """Only files are returned, as sorted absolute paths."""
+        (tmp_path / "b.mov").write_bytes(b"")
+        (tmp_path / "a_log.jsonl").write_text("{}\n")
+        (tmp_path / "subdir").mkdir()
+        assert find_session_files(tmp_path) == [tmp_path.resolve() / "a_log.jsonl", tmp_path.resolve() / "b.mov"]
+
+    def test_symlinked_file_resolves_to_target(self, tmp_path):
+        """A symlink to a file is reported by its target path, as Path.resolve() does."""
+        target = tmp_path / "elsewhere.mov"
+        target.write_bytes(b"")
+        session_dir = tmp_path / "session"
+        session_dir.mkdir()
+        (session_dir / "link.mov").symlink_to(target)
+        assert find_session_files(session_dir) == [target.resolve()]
+
+    def test_ordered_by_entry_name(self, tmp_path):
+        """Files are ordered by their name in the session directory, not by symlink target."""
+        target = tmp_path / "z_elsewhere.mov"
+        target.write_bytes(b"")
+        session_dir = tmp_path / "session"
+        session_dir.mkdir()
+        (session_dir / "b.mov").write_bytes(b"")
+        (session_dir / "a.mov").symlink_to(target)
+        assert find_session_files(session_dir) == [target.resolve(), session_dir.resolve() / "b.mov"]
+
+    def test_missing_directory(self, tmp_path):
+        """A session directory that does not exist has no files."""
+        assert find_session_files(tmp_path / "missing") == []
+
+
+class TestValidateSessionId:
+    """Test session ID format validation."""
+
+    def test_accepts_session_timestamp(self):
+        """A YYYYMMDDTHHMMSSZ timestamp is valid."""
+        assert validate_session_id("20251231T120000Z")
+
+    @pytest.mark.parametrize(
+        "session_id",
+        ["", "20251231T120000", "20251231T120000Z\n", "20251231t120000Z", "2025123XT120000Z", "20251231T12000XZ", "../20251231T1200Z"],
+    )
+    def test_rejects_other_strings(self, session_id):
+        """Anything else, including a trailing newline, is rejected."""
+        assert not validate_session_id(session_id)
+
+
+class TestGetSessionDir:
+    """Test session directory resolution."""
+
+    def test_session_dir_under_base(self, tmp_path, monkeypatch):
+        """The session directory is the resolved base joined with the ID."""
+        monkeypatch.setattr(shutdown_main, "BASE_DATA_DIR", tmp_path)
+        assert get_session_dir("20251231T120000Z") == tmp_path.resolve() / "20251231T120000Z"
+
+    def test_symlink_escaping_base_rejected(self, tmp_path, monkeypatch):
+        """A session directory that links outside the base is refused."""
+        base = tmp_path / "base"
+        base.mkdir()
+        (base / "20251231T120000Z").symlink_to(tmp_path)
+        monkeypatch.setattr(shutdown_main, "BASE_DATA_DIR", base)
+        with pytest.raises(ValueError):
+            get_session_dir("20251231T120000Z")
+
+
+class TestGetExpectedFilenames:
+    """Test the file names shown in the save prompts."""
+
+    def test_names_use_session_date(self):
+        """Both recordings are named after the session's YYYYMMDD date."""
+        assert get_expected_filenames("20251231T120000Z") == ("20251231_webcam.mov", "20251231_iphone.mov")
+
+
+class TestWaitForProcessExits:
+    """Test waiting for the lights processes to exit."""
+
+    @staticmethod
+    def spawn_sleeper(seconds):
+        """Start a child that sleeps, reaped in the background like a detached process."""
+        proc = subprocess.Popen([sys.executable, "-c", f"import time; time.sleep({seconds})"])
+        threading.Thread(target=proc.wait, daemon=True).start()
+        return proc
+
+    def test_returns_when_all_processes_exit(self):
+        """The wait ends with True once every process is gone."""
+        pids = [self.spawn_sleeper(0.1).pid, self.spawn_sleeper(0.3).pid]
+        started = time.monotonic()
+        assert wait_for_process_exits(pids, timeout=10.0) is True
+        assert time.monotonic() - started < 5.0
+
+    def test_times_out_while_a_process_runs(self):
+        """A process still running at the shared timeout gives False."""
+        quick, slow = self.spawn_sleeper(0.1), self.spawn_sleeper(10)
+        try:
+            assert wait_for_process_exits([quick.pid, slow.pid], timeout=0.3) is False
+        finally:
+            slow.kill()
+
+    def test_no_processes(self):
+        """Nothing to wait for counts as all exited."""
+        assert wait_for_process_exits([], timeout=0.0) is True
+
+
+class TestPidsOf:
+    """Test looking up an application's PIDs by process name."""
+
+    def test_finds_running_process(self):
+        """A running process is found by its exact name."""
+        proc = subprocess.Popen(["sleep", "30"])
+        try:
+            assert proc.pid in _pids_of("sleep")
+        finally:
+            proc.kill()
+            proc.wait()
+
+    def test_no_match(self):
+        """A name no process has gives an empty list."""
+        assert _pids_of("no-such-proc") == []
+
+    def test_regex_characters_matched_literally(self, tmp_path):
+        """Regex characters in the name only match themselves."""
+        exe = tmp_path / "a.c"
+        shutil.copy(shutil.which("sleep"), exe)
+        proc = subprocess.Popen([exe, "30"])
+        try:
+            assert proc.pid in _pids_of("a.c")
+            assert proc.pid not in _pids_of("a.")
+            assert _pids_of("a.*") == []
+        finally:
+            proc.kill()
+            proc.wait()
+
+    def test_name_too_long_for_pgrep(self):
+        """Names pgrep cannot match exactly are reported as unknown."""
+        assert _pids_of("x" * (PGREP_NAME_MAX + 1)) is None
+
+
+class TestIsAppRunning:
+    """Test the running check and reuse of recent answers."""
+
+    @pytest.fixture
+    def lookups(self, monkeypatch):
+        """Replace the pgrep lookup with a stub finding one PID and count the calls."""
+        calls = []
+
+        def fake_pids_of(process_name):
+            calls.append(process_name)
+            return [123]
+
+        monkeypatch.setattr(shutdown_utils, "_pids_of", fake_pids_of)
+        monkeypatch.setattr(shutdown_utils, "_running_cache", {})
+        return calls
+
+    def test_repeat_check_reuses_answer(self, lookups):
+        """A second check within the TTL does not look the process up again."""
+        assert is_app_running("Live") is True
+        assert is_app_running("Live") is True
+        assert len(lookups) == 1
+
+    def test_expired_or_invalidated_answer_rechecked(self, lookups, monkeypatch):
+        """Invalidation and TTL expiry both force a fresh check."""
+        is_app_running("Live")
+        invalidate_app_cache("Live")
+        is_app_running("Live")
+        monkeypatch.setattr(shutdown_utils, "APP_RUNNING_CACHE_TTL_SEC", 0.0)
+        is_app_running("Live")
+        assert len(lookups) == 3
+
+    def test_falls_back_to_applescript(self, monkeypatch):
+        """Names pgrep cannot look up are checked through System Events."""
+        scripts = []
+
+        def fake_run_applescript(script):
+            scripts.append(script)
+            return True, "true", ""
+
+        monkeypatch.setattr(shutdown_utils, "_running_cache", {})
+        monkeypatch.setattr(shutdown_utils, "run_applescript", fake_run_applescript)
+        assert is_app_running("x" * (PGREP_NAME_MAX + 1)) is True
+        assert len(scripts) == 1 and "System Events" in scripts[0]
+
+    @pytest.mark.parametrize(("answer", "running"), [("true", True), ("false", False)])
+    def test_pgrep_miss_confirmed_by_applescript(self, monkeypatch, answer, running):
+        """A name pgrep does not find (e.g. a display name) is checked through System Events."""
+        scripts = []
+
+        def fake_run_applescript(script):
+            scripts.append(script)
+            return True, answer, ""
+
+        monkeypatch.setattr(shutdown_utils, "_running_cache", {})
+        monkeypatch.setattr(shutdown_utils, "run_applescript", fake_run_applescript)
+        assert is_app_running("no-such-proc") is running
+        assert len(scripts) == 1
+
+
+class TestAppleScriptSource:
+    """Test the generated AppleScript source."""
+
+    def test_string_literal_escaping(self):
+        """Quotes and backslashes cannot end the AppleScript string early."""
+        assert _applescript_string('My "App" \\ 2') == '"My \\"App\\" \\\\ 2"'
+
+    def test_quit_script_built_once_per_app(self):
+        """The same app gets the same cached script text."""
+        script = _quit_script("QuickTime Player", "QuickTime Player")
+        assert _quit_script("QuickTime Player", "QuickTime Player") is script
+        assert 'tell application "QuickTime Player"' in script
+
+
+class TestStopLaunchpadLights:
+    """Test stopping the lights process recorded in lights.pid."""
+
+    @pytest.fixture(autouse=True)
+    def pgrep_listing(self, tmp_path, monkeypatch):
+        """Replace pgrep with a script printing this file (no match while it is empty).
+
+        Keeps the tests from signalling a real lights process on this machine.
+        """
+        listing = tmp_path / "pgrep.out"
+        listing.touch()
+        script = tmp_path / "pgrep"
+        script.write_text(f'#!/bin/sh\n[ -s "{listing}" ] || exit 1\ncat "{listing}"\n')
+        script.chmod(0o755)
+        monkeypatch.setattr(shutdown_utils, "PGREP_BIN", str(script))
+        return listing
+
+    def test_stops_pid_from_file_and_removes_it(self, tmp_path):
+        """The PID in lights.pid is terminated and the file is deleted."""
+        proc = TestWaitForProcessExits.spawn_sleeper(30)
+        (tmp_path / "lights.pid").write_text(f"{proc.pid}\n")
+        try:
+            assert stop_launchpad_lights(tmp_path) == (True, proc.pid)
+        finally:
+            proc.kill()
+        assert not (tmp_path / "lights.pid").exists()
+
+    def test_stops_pid_found_by_pgrep(self, tmp_path, pgrep_listing):
+        """A lights process missing from lights.pid is found by its command line."""
+        proc = TestWaitForProcessExits.spawn_sleeper(30)
+        pgrep_listing.write_text(f"{proc.pid}\n")
+        try:
+            assert stop_launchpad_lights(tmp_path) == (True, proc.pid)
+        finally:
+            proc.kill()
+
+    def test_invalid_pid_file_is_removed(self, tmp_path):
+        """A PID file that does not hold a number is ignored and deleted."""
+        (tmp_path / "lights.pid").write_text("not a pid\n")
+        assert stop_launchpad_lights(tmp_path) == (True, None)
+        assert not (tmp_path / "lights.pid").exists()
+
+    def test_no_pid_file(self, tmp_path):
+        """Without a PID file (and no running lights process) nothing is stopped."""
+        assert stop_launchpad_lights(tmp_path) == (True, None)
+
+
+class TestWaitForFile:
+    """Test waiting for a file to appear."""
+
+    def test_existing_file(self, tmp_path):
+        """A file that already exists is reported at once."""
+        (tmp_path / "a.mov").write_bytes(b"")
+        assert wait_for_file(tmp_path / "a.mov", timeout_seconds=0.0) is True
+
+    def test_file_created_while_waiting(self, tmp_path):
+        """A file created during the wait ends it with True."""
+        target = tmp_path / "a.mov"
+        timer = threading.Timer(0.1, target.write_bytes, args=(b"",))
+        timer.start()
+        try:
+            assert wait_for_file(target, timeout_seconds=5.0, poll_interval=0.05) is True
+        finally:
+            timer.cancel()
+
+    def test_times_out(self, tmp_path):
+        """A file that never appears gives False after the timeout."""
+        assert wait_for_file(tmp_path / "a.mov", timeout_seconds=0.2, poll_interval=0.05) is False
+
+
+class TestWaitForFilesStable:
+    """Test waiting for recordings to stop growing."""
+
+    def test_returns_file_once_size_settles(self, tmp_path):
+        """A matching file whose size stops changing is returned."""
+        (tmp_path / "a.mov").write_bytes(b"x")
+        (tmp_path / "notes.txt").write_bytes(b"x")
+        started = time.monotonic()
+        assert wait_for_files_stable(tmp_path, "*.mov", timeout_seconds=5.0, stability_seconds=0.2, poll_interval=0.05) == [tmp_path / "a.mov"]
+        assert time.monotonic() - started >= 0.2
+
+    def test_growing_file_is_not_stable(self, tmp_path):
+        """A file still being written to is not returned before the timeout."""
+        target = tmp_path / "a.mov"
+        target.write_bytes(b"")
+        stop = threading.Event()
+
+        def grow():
+            with target.open("ab") as fh:
+                while not stop.wait(0.02):
+                    fh.write(b"x")
+                    fh.flush()
+
+        writer = threading.Thread(target=grow)
+        writer.start()
+        try:
+            assert wait_for_files_stable(tmp_path, "*.mov", timeout_seconds=0.5, stability_seconds=0.3, poll_interval=0.05) == []
+        finally:
+            stop.set()
+            writer.join()
+
+    def test_no_matching_files(self, tmp_path):
+        """Nothing matching the pattern gives an empty list after the timeout."""
+        assert wait_for_files_stable(tmp_path, "*.mov", timeout_seconds=0.2, poll_interval=0.05) == []
+
+    def test_ignores_directories_and_other_names(self, tmp_path):
+        """Only regular files whose names match the pattern (case-sensitively) are considered."""
+        (tmp_path / "clip.mov").mkdir()
+        (tmp_path / "a.MOV").write_bytes(b"x")
+        (tmp_path / "b.mov").write_bytes(b"x")
+        assert wait_for_files_stable(tmp_path, "*.mov", timeout_seconds=5.0, stability_seconds=0.1, poll_interval=0.05) == [tmp_path / "b.mov"]
+
+    def test_missing_directory(self, tmp_path):
+        """A directory that does not exist has no stable files."""
+        assert wait_for_files_stable(tmp_path / "missing", "*.mov", timeout_seconds=0.1, poll_interval=0.05) == []